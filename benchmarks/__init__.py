@@ -0,0 +1 @@
+"""Offline benchmarks for LIFX Ceiling using emulated devices."""
@@ -0,0 +1,198 @@
+"""A local UDP stand-in for LIFX Ceiling devices."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import bitstring
+from aiolifx.message import little_endian
+from aiolifx.msgtypes import (
+    Acknowledgement,
+    LightGetPower,
+    LightSetPower,
+    LightStatePower,
+    TileGet64,
+    TileSet64,
+    TileState64,
+)
+from aiolifx.unpack import unpack_lifx_message
+
+if TYPE_CHECKING:
+    from aiolifx.message import Message
+
+# Matrix size of the original Ceiling
+CEILING_MATRIX_WIDTH = 8
+CEILING_MATRIX_HEIGHT = 8
+
+# Number of colors carried by every Set64 and State64 message
+SET64_ZONE_COUNT = 64
+
+
+class _TileState64(TileState64):
+    """State64 with the reserved byte that aiolifx leaves out when packing."""
+
+    def get_payload(self) -> bytes:
+        """Pack the payload the same way a real device does."""
+        header = b"".join(
+            little_endian(bitstring.pack("uint:8", value))
+            for value in (self.tile_index, 0, self.x, self.y, self.width)
+        )
+        return header + b"".join(
+            little_endian(bitstring.pack("uint:16", value))
+            for color in self.colors
+            for value in color
+        )
+
+
+@dataclass(slots=True)
+class EmulatedCeiling:
+    """The state of a single emulated LIFX Ceiling."""
+
+    mac_addr: str
+    width: int = CEILING_MATRIX_WIDTH
+    height: int = CEILING_MATRIX_HEIGHT
+    power_level: int = 65535
+    zones: list[tuple[int, int, int, int]] = field(default_factory=list)
+    set64_count: int = 0
+
+    def __post_init__(self) -> None:
+        """Light every zone at full brightness."""
+        if not self.zones:
+            self.zones = [(0, 0, 65535, 3500)] * (self.width * self.height)
+
+    def apply_set64(self, message: Any) -> None:
+        """Apply the rectangle of a Set64 message to the zones."""
+        self.set64_count += 1
+        for index, color in enumerate(message.colors):
+            column = message.x + index % message.width
+            row = message.y + index // message.width
+            if column < self.width and row < self.height:
+                self.zones[row * self.width + column] = tuple(color)
+
+    def read64(self, x: int, y: int, width: int) -> list[tuple[int, int, int, int]]:
+        """
+        Return the 64 colors of the rectangle a Get64 message asks for.
+
+        Like a real device, the rectangle runs from y down at the given width
+        and positions outside the matrix are sent as black.
+        """
+        colors = []
+        for index in range(SET64_ZONE_COUNT):
+            column = x + index % width
+            row = y + index // width
+            if column < self.width and row < self.height:
+                colors.append(self.zones[row * self.width + column])
+            else:
+                colors.append((0, 0, 0, 3500))
+        return colors
+
+
+class CeilingEmulator(asyncio.DatagramProtocol):
+    """
+    Answer LIFX messages for any number of emulated Ceilings on one socket.
+
+    Supports Get64, Set64, GetPower and SetPower. Every request is dropped
+    with a probability of loss, and every reply is delayed by latency seconds,
+    so retries and slow networks can be reproduced.
+    """
+
+    def __init__(self, latency: float = 0, loss: float = 0, seed: int = 0) -> None:
+        """Initialize the emulator."""
+        self.latency = latency
+        self.loss = loss
+        self.devices: dict[str, EmulatedCeiling] = {}
+        self.received = 0
+        self.dropped = 0
+        self._random = random.Random(seed)  # noqa: S311
+        self._transport: asyncio.DatagramTransport | None = None
+
+    def add_device(
+        self,
+        mac_addr: str,
+        width: int = CEILING_MATRIX_WIDTH,
+        height: int = CEILING_MATRIX_HEIGHT,
+    ) -> EmulatedCeiling:
+        """Add an emulated Ceiling with the given MAC address and matrix size."""
+        device = EmulatedCeiling(mac_addr, width, height)
+        self.devices[mac_addr] = device
+        return device
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Store the transport used to send replies."""
+        assert isinstance(transport, asyncio.DatagramTransport)  # noqa: S101
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Handle a request for one of the emulated devices."""
+        self.received += 1
+        if self.loss and self._random.random() < self.loss:
+            self.dropped += 1
+            return
+
+        request = unpack_lifx_message(data)
+        if (device := self.devices.get(request.target_addr)) is None:
+            return
+
+        replies: list[Message] = []
+        if request.ack_requested:
+            replies.append(self._reply(Acknowledgement, request, {}))
+
+        if isinstance(request, TileSet64):
+            device.apply_set64(request)
+        elif isinstance(request, LightSetPower):
+            device.power_level = request.power_level
+        elif isinstance(request, LightGetPower):
+            replies.append(
+                self._reply(
+                    LightStatePower, request, {"power_level": device.power_level}
+                )
+            )
+        elif isinstance(request, TileGet64):
+            replies.append(
+                self._reply(
+                    _TileState64,
+                    request,
+                    {
+                        "tile_index": request.tile_index,
+                        "x": request.x,
+                        "y": request.y,
+                        "width": request.width,
+                        "colors": device.read64(request.x, request.y, request.width),
+                    },
+                )
+            )
+
+        for reply in replies:
+            if self.latency:
+                asyncio.get_running_loop().call_later(
+                    self.latency, self._send, reply, addr
+                )
+            else:
+                self._send(reply, addr)
+
+    @staticmethod
+    def _reply(
+        message_type: type[Message], request: Message, payload: dict[str, Any]
+    ) -> Message:
+        """Build a reply addressed back to the sender of the request."""
+        return message_type(
+            request.target_addr, request.source_id, request.seq_num, payload
+        )
+
+    def _send(self, message: Message, addr: tuple[str, int]) -> None:
+        """Send a reply if the socket is still open."""
+        if self._transport is not None:
+            self._transport.sendto(message.packed_message, addr)
+
+
+async def async_start_emulator(
+    latency: float = 0, loss: float = 0, seed: int = 0
+) -> tuple[CeilingEmulator, asyncio.DatagramTransport, int]:
+    """Start an emulator on a free local port and return it with its port."""
+    transport, emulator = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: CeilingEmulator(latency, loss, seed), local_addr=("127.0.0.1", 0)
+    )
+    return emulator, transport, transport.get_extra_info("sockname")[1]
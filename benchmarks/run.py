@@ -0,0 +1,287 @@
+"""
+Benchmark LIFX Ceiling command paths against emulated devices.
+
+Run from the repository root with the Home Assistant requirements installed:
+
+    python -m benchmarks.run --latency 0.005 --loss 0.02 --devices 1 10 50 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from aiolifx.aiolifx import Light
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+
+from custom_components.lifx_ceiling.api import LIFXCeiling
+from custom_components.lifx_ceiling.const import (
+    ATTR_DOWNLIGHT_BRIGHTNESS,
+    ATTR_UPLIGHT_BRIGHTNESS,
+    DOMAIN,
+    NAME,
+    SERVICE_LIFX_CEILING_SET_STATE,
+)
+from custom_components.lifx_ceiling.coordinator import LIFXCeilingUpdateCoordinator
+from custom_components.lifx_ceiling.geometry import geometry_for_product
+from custom_components.lifx_ceiling.light import LIFXCeilingDownlight
+
+from .emulator import CeilingEmulator, async_start_emulator
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+CEILING_PRODUCT_ID = 176
+
+# The 13x26" Ceiling, which has a 16x8 matrix
+CEILING_CAPSULE_PRODUCT_ID = 201
+
+
+async def async_connect_ceiling(
+    emulator: CeilingEmulator,
+    port: int,
+    index: int,
+    product: int = CEILING_PRODUCT_ID,
+) -> LIFXCeiling:
+    """Connect a LIFXCeiling to a new emulated device, as the core LIFX one does."""
+    mac_addr = f"d0:73:d5:00:{index // 256:02x}:{index % 256:02x}"
+    geometry = geometry_for_product(product)
+    emulated = emulator.add_device(mac_addr, geometry.width, geometry.height)
+
+    loop = asyncio.get_running_loop()
+    light = Light(loop, mac_addr, "127.0.0.1", port)
+    await loop.create_datagram_endpoint(lambda: light, remote_addr=("127.0.0.1", port))
+    light.product = product
+    light.tile_device_width = geometry.width
+    light.power_level = emulated.power_level
+    light.chain = {0: list(emulated.zones)}
+    light.label = f"Ceiling {index}"
+    return LIFXCeiling.cast(light)
+
+
+def report(name: str, timings: list[float], unit: str = "ms") -> None:
+    """Write a line of summary statistics for a set of timings in seconds."""
+    scale = 1000 if unit == "ms" else 1_000_000
+    values = sorted(value * scale for value in timings)
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    sys.stdout.write(
+        f"{name:<40} n={len(values):<6} "
+        f"mean={statistics.fmean(values):9.3f}{unit} "
+        f"p50={statistics.median(values):9.3f}{unit} "
+        f"p95={p95:9.3f}{unit} max={values[-1]:9.3f}{unit}\n"
+    )
+
+
+async def async_time(
+    iterations: int, action: Callable[[int], Awaitable[Any]]
+) -> list[float]:
+    """Return the time taken by each of a number of awaited actions."""
+    timings = []
+    for iteration in range(iterations):
+        started = time.perf_counter()
+        await action(iteration)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def async_bench_commands(
+    emulator: CeilingEmulator, port: int, iterations: int, index: int, product: int
+) -> None:
+    """
+    Time each LIFXCeiling command path against a single emulated device.
+
+    Raises a RuntimeError when the emulated zones do not end up matching the
+    colors the device believes it has written.
+    """
+    device = await async_connect_ceiling(emulator, port, index, product)
+    emulated = emulator.devices[device.mac_addr]
+    size = f"{device.geometry.width}x{device.geometry.height}"
+
+    report(
+        f"downlight color {size}",
+        await async_time(
+            iterations,
+            lambda i: device.async_apply_sections(
+                downlight_on=True, downlight_color=(i * 997 % 65536, 0, 40000, 3500)
+            ),
+        ),
+    )
+    report(
+        f"uplight color {size}",
+        await async_time(
+            iterations,
+            lambda i: device.async_apply_sections(
+                uplight_on=True, uplight_color=(i * 997 % 65536, 0, 40000, 3500)
+            ),
+        ),
+    )
+
+    async def _toggle_downlight(iteration: int) -> None:
+        await device.async_apply_sections(downlight_on=iteration % 2 == 0)
+
+    report(f"downlight on/off {size}", await async_time(iterations, _toggle_downlight))
+
+    async def _power_cycle(iteration: int) -> None:
+        on = iteration % 2 == 0
+        await device.async_apply_sections(downlight_on=on, uplight_on=on)
+
+    report(f"power on/off {size}", await async_time(iterations, _power_cycle))
+
+    await device.async_apply_sections(downlight_on=True, uplight_on=True)
+    written = list(device.chain[0])
+    report(
+        f"refresh zones {size}",
+        await async_time(iterations, lambda _: device.async_refresh_zones()),
+    )
+    if emulated.zones != written or device.chain[0] != written:
+        msg = f"Zones of the {size} device do not match what was written"
+        raise RuntimeError(msg)
+
+
+async def async_bench_set_state(
+    emulator: CeilingEmulator, port: int, device_counts: list[int], iterations: int
+) -> None:
+    """Time set_state across increasing numbers of emulated devices."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entry = ConfigEntry(
+            data={},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options={},
+            source="user",
+            subentries_data=None,
+            title=NAME,
+            unique_id=DOMAIN,
+            version=1,
+        )
+        coordinator = LIFXCeilingUpdateCoordinator(hass, entry)
+
+        devices: list[LIFXCeiling] = []
+        for count in device_counts:
+            while len(devices) < count:
+                device = await async_connect_ceiling(
+                    emulator, port, len(emulator.devices)
+                )
+                coordinator._device_index[device.mac_addr] = device  # noqa: SLF001
+                devices.append(device)
+
+            device_ids = [device.mac_addr for device in devices[:count]]
+            spreads: list[float] = []
+
+            async def _set_state(
+                iteration: int,
+                device_ids: list[str] = device_ids,
+                spreads: list[float] = spreads,
+            ) -> None:
+                brightness = 20 + iteration % 80
+                response = await coordinator.async_set_state(
+                    ServiceCall(
+                        hass,
+                        DOMAIN,
+                        SERVICE_LIFX_CEILING_SET_STATE,
+                        {
+                            ATTR_DEVICE_ID: device_ids,
+                            ATTR_DOWNLIGHT_BRIGHTNESS: brightness,
+                            ATTR_UPLIGHT_BRIGHTNESS: brightness,
+                        },
+                        return_response=True,
+                    )
+                )
+
+                assert response is not None  # noqa: S101
+                spreads.append(response["spread_ms"] / 1000)
+
+            report(
+                f"set_state x{count} devices", await async_time(iterations, _set_state)
+            )
+            report(f"set_state x{count} send spread", spreads)
+
+        await hass.async_stop(force=True)
+
+
+def bench_update_callback(iterations: int) -> None:
+    """Time the light entity update callback with and without new zone colors."""
+    loop = asyncio.get_running_loop()
+    light = Light(loop, "d0:73:d5:ff:ff:ff", "127.0.0.1")
+    light.product = CEILING_PRODUCT_ID
+    light.power_level = 65535
+    light.chain = {0: [(0, 0, 65535, 3500)] * 64}
+    device = LIFXCeiling.cast(light)
+
+    entity = LIFXCeilingDownlight(None, device)  # type: ignore[arg-type]
+    # Only the callback is measured, not writing the state to Home Assistant.
+    entity.async_write_ha_state = lambda: None  # type: ignore[method-assign]
+
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        entity._update_callback()  # noqa: SLF001
+        timings.append(time.perf_counter() - started)
+    report("_update_callback unchanged", timings, "us")
+
+    class _State64:
+        def __init__(self, brightness: int) -> None:
+            self.tile_index = 0
+            self.x = 0
+            self.y = 0
+            self.width = 8
+            self.colors = [(0, 0, brightness, 3500)] * 64
+
+    responses = [_State64(brightness) for brightness in range(1, iterations + 1)]
+    timings = []
+    for response in responses:
+        device.resp_set_tile64(response)
+        started = time.perf_counter()
+        entity._update_callback()  # noqa: SLF001
+        timings.append(time.perf_counter() - started)
+    report("_update_callback new zones", timings, "us")
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run every benchmark."""
+    emulator, transport, port = await async_start_emulator(
+        args.latency, args.loss, args.seed
+    )
+    sys.stdout.write(
+        f"latency={args.latency * 1000:g}ms loss={args.loss:.1%} "
+        f"iterations={args.iterations}\n"
+    )
+    try:
+        await async_bench_commands(
+            emulator, port, args.iterations, 0, CEILING_PRODUCT_ID
+        )
+        await async_bench_commands(
+            emulator, port, args.iterations, 1, CEILING_CAPSULE_PRODUCT_ID
+        )
+        await async_bench_set_state(emulator, port, args.devices, args.iterations)
+        bench_update_callback(args.iterations * 10)
+    finally:
+        transport.close()
+    sys.stdout.write(
+        f"emulator received {emulator.received} packets, dropped {emulator.dropped}\n"
+    )
+
+
+def main() -> None:
+    """Parse the command line and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds")
+    parser.add_argument("--loss", type=float, default=0.0, help="0 to 1")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 50, 200])
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,126 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import voluptuous as vol
+from aiolifx_themes.themes import ThemeLibrary
+from homeassistant.components.light import ATTR_BRIGHTNESS_PCT, ATTR_TRANSITION
 from homeassistant.const import Platform
+from homeassistant.core import SupportsResponse
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
     _LOGGER,
+    ATTR_ANGLE,
+    ATTR_COLORS,
+    ATTR_EFFECT,
+    ATTR_END_COLOR,
+    ATTR_FPS,
+    ATTR_IMAGE,
+    ATTR_KELVIN,
+    ATTR_PATTERN,
+    ATTR_PERIOD,
+    ATTR_START_COLOR,
+    ATTR_THEME,
     DISCOVERY_INTERVAL,
     DOMAIN,
+    EFFECT_MAX_FPS,
+    EFFECT_THEME,
+    EFFECTS,
     NAME,
+    PATTERN_IMAGE,
+    PATTERNS,
+    SERVICE_LIFX_CEILING_PAUSE_FADE,
+    SERVICE_LIFX_CEILING_RESUME_FADE,
+    SERVICE_LIFX_CEILING_SET_DOWNLIGHT_PATTERN,
     SERVICE_LIFX_CEILING_SET_STATE,
+    SERVICE_LIFX_CEILING_START_EFFECT,
+    SERVICE_LIFX_CEILING_STOP_EFFECT,
 )
 from .coordinator import LIFXCeilingConfigEntry, LIFXCeilingUpdateCoordinator
+from .store import LIFXCeilingStore
 from .util import async_get_legacy_entries, has_single_config_entry
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant, ServiceCall
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
     from homeassistant.helpers.typing import ConfigType
 
 
-PLATFORMS: list[Platform] = [Platform.LIGHT]
+PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.SENSOR]
+
+RGB_COLOR = vol.All(vol.Coerce(tuple), vol.ExactSequence((cv.byte,) * 3))
+
+SET_DOWNLIGHT_PATTERN_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **cv.ENTITY_SERVICE_FIELDS,
+            vol.Required(ATTR_PATTERN): vol.In(PATTERNS),
+            vol.Optional(ATTR_START_COLOR, default=(255, 255, 255)): RGB_COLOR,
+            vol.Optional(ATTR_END_COLOR, default=(0, 0, 0)): RGB_COLOR,
+            vol.Optional(ATTR_ANGLE, default=0): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=359)
+            ),
+            vol.Optional(ATTR_IMAGE): cv.isfile,
+            vol.Optional(ATTR_BRIGHTNESS_PCT, default=100): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=100)
+            ),
+            vol.Optional(ATTR_KELVIN, default=3500): vol.All(
+                vol.Coerce(int), vol.Range(min=1500, max=9000)
+            ),
+            vol.Optional(ATTR_TRANSITION, default=0): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=3600)
+            ),
+        }
+    ),
+    cv.key_value_schemas(
+        ATTR_PATTERN,
+        {
+            PATTERN_IMAGE: vol.Schema(
+                {vol.Required(ATTR_IMAGE): cv.isfile}, extra=vol.ALLOW_EXTRA
+            )
+        },
+        default_schema=vol.Schema({}, extra=vol.ALLOW_EXTRA),
+    ),
+)
+
+START_EFFECT_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **cv.ENTITY_SERVICE_FIELDS,
+            vol.Required(ATTR_EFFECT): vol.In(EFFECTS),
+            vol.Optional(ATTR_COLORS, default=[(255, 255, 255)]): vol.All(
+                cv.ensure_list, [RGB_COLOR], vol.Length(min=1)
+            ),
+            vol.Optional(ATTR_THEME): vol.In(ThemeLibrary().themes),
+            vol.Optional(ATTR_PERIOD, default=10): vol.All(
+                vol.Coerce(float), vol.Range(min=0.5, max=3600)
+            ),
+            vol.Optional(ATTR_FPS, default=10): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1, max=EFFECT_MAX_FPS)
+            ),
+            vol.Optional(ATTR_BRIGHTNESS_PCT, default=100): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=100)
+            ),
+            vol.Optional(ATTR_KELVIN, default=3500): vol.All(
+                vol.Coerce(int), vol.Range(min=1500, max=9000)
+            ),
+        }
+    ),
+    cv.key_value_schemas(
+        ATTR_EFFECT,
+        {
+            EFFECT_THEME: vol.Schema(
+                {vol.Required(ATTR_THEME): vol.In(ThemeLibrary().themes)},
+                extra=vol.ALLOW_EXTRA,
+            )
+        },
+        default_schema=vol.Schema({}, extra=vol.ALLOW_EXTRA),
+    ),
+)
+
+STOP_EFFECT_SCHEMA = vol.Schema(cv.ENTITY_SERVICE_FIELDS)
+
+FADE_SCHEMA = vol.Schema(cv.ENTITY_SERVICE_FIELDS)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -61,26 +162,101 @@ async def async_setup_entry(
 ) -> bool:
     """Set up LIFX Ceiling."""
     coordinator = LIFXCeilingUpdateCoordinator(hass, config_entry)
+    coordinator.async_start()
+    await coordinator.async_load_stored_state()
     await coordinator.async_update()
 
     config_entry.runtime_data = coordinator
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    async def handle_set_state(call: ServiceCall) -> None:
+    async def handle_set_state(call: ServiceCall) -> ServiceResponse:
         """Handle the set_state service call."""
-        await coordinator.async_set_state(call)
+        return await coordinator.async_set_state(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_SET_STATE,
+        handle_set_state,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_set_downlight_pattern(call: ServiceCall) -> ServiceResponse:
+        """Handle the set_downlight_pattern service call."""
+        return await coordinator.async_set_downlight_pattern(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_SET_DOWNLIGHT_PATTERN,
+        handle_set_downlight_pattern,
+        schema=SET_DOWNLIGHT_PATTERN_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_start_effect(call: ServiceCall) -> ServiceResponse:
+        """Handle the start_effect service call."""
+        return await coordinator.async_start_effect(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_START_EFFECT,
+        handle_start_effect,
+        schema=START_EFFECT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_stop_effect(call: ServiceCall) -> ServiceResponse:
+        """Handle the stop_effect service call."""
+        return await coordinator.async_stop_effect(call)
 
     hass.services.async_register(
-        DOMAIN, SERVICE_LIFX_CEILING_SET_STATE, handle_set_state
+        DOMAIN,
+        SERVICE_LIFX_CEILING_STOP_EFFECT,
+        handle_stop_effect,
+        schema=STOP_EFFECT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_pause_fade(call: ServiceCall) -> ServiceResponse:
+        """Handle the pause_fade service call."""
+        return await coordinator.async_pause_fade(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_PAUSE_FADE,
+        handle_pause_fade,
+        schema=FADE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def handle_resume_fade(call: ServiceCall) -> ServiceResponse:
+        """Handle the resume_fade service call."""
+        return await coordinator.async_resume_fade(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_LIFX_CEILING_RESUME_FADE,
+        handle_resume_fade,
+        schema=FADE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     coordinator.stop_discovery = async_track_time_interval(
         hass, coordinator.async_update, DISCOVERY_INTERVAL
     )
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(_async_options_updated)
+    )
 
     return True
 
 
+async def _async_options_updated(
+    hass: HomeAssistant, entry: LIFXCeilingConfigEntry
+) -> None:
+    """Reload the config entry so zone group lights are added or removed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(
     hass: HomeAssistant, entry: LIFXCeilingConfigEntry
 ) -> bool:
@@ -89,3 +265,10 @@ async def async_unload_entry(
     if data.stop_discovery is not None and callable(data.stop_discovery):
         data.stop_discovery()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: LIFXCeilingConfigEntry
+) -> None:
+    """Delete the remembered device state when the config entry is removed."""
+    await LIFXCeilingStore(hass).async_remove()
@@ -2,20 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from aiolifx.aiolifx import UDP_BROADCAST_PORT, Light
+from aiolifx.msgtypes import LightGetPower, LightStatePower, TileGet64, TileState64
 from aiolifx.products import product_map
 from aiolifx.products_defs import features_map
-from homeassistant.components.lifx.util import async_execute_lifx
+from homeassistant.components.lifx.util import (
+    async_execute_lifx,
+    async_multi_execute_lifx_with_retries,
+)
+
+from .const import _LOGGER, LOCAL_FADE_MIN_DURATION
+from .convert import brightness_to_8bit, hs_from_16bit
+from .fade import LIFXCeilingFade
+from .frame import HSBKFrame
+from .geometry import CeilingGeometry, geometry_for_product, zone_group_ranges
+from .metrics import LIFXCeilingMetrics
+from .write_queue import LIFXCeilingWriteQueue
 
 if TYPE_CHECKING:
-    import asyncio
+    from collections.abc import Mapping, Sequence
 
 MESSAGE_TIMEOUT = 3
-
-CEILING_ZONE_COUNT = 64
+REFRESH_ATTEMPTS = 3
 
 
 class LIFXCeilingError(Exception):
@@ -35,10 +48,35 @@ class LIFXCeiling(Light):
     ) -> None:
         """Initialize the LIFX Ceiling."""
         super().__init__(loop, mac_addr, ip_addr, port, parent)
-        self._configured_downlight_brightness: int = self.downlight_brightness
-        self._configured_uplight_brightness: int = self.uplight_brightness
+        self._geometry = geometry_for_product(self.product)
+        self._frame = HSBKFrame(self._geometry.zone_count)
+        self._sent_frame = HSBKFrame(self._geometry.zone_count)
+        self._resend_all = False
+        self._metrics = LIFXCeilingMetrics()
+        self._write_queue = LIFXCeilingWriteQueue(
+            self,
+            self._metrics,
+            self._geometry.zone_count,
+            self._geometry.width,
+            MESSAGE_TIMEOUT,
+        )
+        self._frame_generation: int = -1
+        self._zone_generation: int = 0
+        self._zone_reads: int = 0
+        self._last_sent_at: float | None = None
+        self._zone_cache_generation: int = -1
+        self._zone_cache: tuple[int, tuple[float, float], tuple[float, float]] = (
+            0,
+            (0, 0),
+            (0, 0),
+        )
+        self._configured_downlight_brightness: int = self._zone_aggregates()[0]
+        self._configured_uplight_brightness: int = self._uplight_zone()[2]
         self._is_downlight_on: bool = False
         self._is_uplight_on: bool = False
+        self._last_downlight_color: tuple[int, int, int, int] | None = None
+        self._last_uplight_color: tuple[int, int, int, int] | None = None
+        self._fade: LIFXCeilingFade | None = None
 
     @classmethod
     def cast(cls, device: Light) -> LIFXCeiling:
@@ -46,16 +84,388 @@ class LIFXCeiling(Light):
         assert isinstance(device, Light)  # noqa: S101
         device.__class__ = cls
         assert isinstance(device, LIFXCeiling)  # noqa: S101
-        device._configured_downlight_brightness = device.downlight_brightness  # noqa: SLF001
-        device._configured_uplight_brightness = device.uplight_brightness  # noqa: SLF001
+        if getattr(device, "_fade", None) is not None:
+            # The device was adopted before and may still be fading.
+            device.stop_fade()
+        geometry = geometry_for_product(device.product)
+        device._geometry = geometry  # noqa: SLF001
+        device._frame = HSBKFrame(geometry.zone_count)  # noqa: SLF001
+        device._sent_frame = HSBKFrame(geometry.zone_count)  # noqa: SLF001
+        device._resend_all = False  # noqa: SLF001
+        device._metrics = LIFXCeilingMetrics()  # noqa: SLF001
+        device._write_queue = LIFXCeilingWriteQueue(  # noqa: SLF001
+            device,
+            device._metrics,  # noqa: SLF001
+            geometry.zone_count,
+            geometry.width,
+            MESSAGE_TIMEOUT,
+        )
+        device._frame_generation = -1  # noqa: SLF001
+        device._zone_generation = 0  # noqa: SLF001
+        device._zone_reads = 0  # noqa: SLF001
+        device._last_sent_at = None  # noqa: SLF001
+        device._zone_cache_generation = -1  # noqa: SLF001
+        device._configured_downlight_brightness = device._zone_aggregates()[0]  # noqa: SLF001
+        device._configured_uplight_brightness = device._uplight_zone()[2]  # noqa: SLF001
         device._is_downlight_on = bool(  # noqa: SLF001
-            device.power_level > 0 and device.downlight_brightness > 0
+            device.power_level > 0 and device._configured_downlight_brightness > 0  # noqa: SLF001
         )
         device._is_uplight_on = bool(  # noqa: SLF001
-            device.power_level > 0 and device.uplight_brightness > 0
+            device.power_level > 0 and device._configured_uplight_brightness > 0  # noqa: SLF001
         )
+        device._last_downlight_color = None  # noqa: SLF001
+        device._last_uplight_color = None  # noqa: SLF001
+        device._fade = None  # noqa: SLF001
         return device
 
+    def state_to_store(self) -> dict[str, Any]:
+        """Return the section state to remember across restarts."""
+        if self._is_downlight_on:
+            self._last_downlight_color = self.downlight_color
+        if self._is_uplight_on:
+            self._last_uplight_color = self.uplight_color
+        return {
+            "downlight_on": self._is_downlight_on,
+            "uplight_on": self._is_uplight_on,
+            "configured_downlight_brightness": self._configured_downlight_brightness,
+            "configured_uplight_brightness": self._configured_uplight_brightness,
+            "downlight_color": self._last_downlight_color,
+            "uplight_color": self._last_uplight_color,
+        }
+
+    def restore_state(self, data: Mapping[str, Any]) -> None:
+        """
+        Restore the section state remembered before a restart.
+
+        The configured brightness and last color are only restored for sections
+        that are off, so they turn back on as they were. A section that is on
+        keeps the brightness read from the device, which may have been changed
+        while Home Assistant was not running. Whether each section is on is
+        always taken from the device itself.
+        """
+        if not self._is_downlight_on:
+            self._configured_downlight_brightness = data.get(
+                "configured_downlight_brightness",
+                self._configured_downlight_brightness,
+            )
+            if (color := data.get("downlight_color")) is not None:
+                self._last_downlight_color = tuple(color)
+        if not self._is_uplight_on:
+            self._configured_uplight_brightness = data.get(
+                "configured_uplight_brightness", self._configured_uplight_brightness
+            )
+            if (color := data.get("uplight_color")) is not None:
+                self._last_uplight_color = tuple(color)
+
+    def resp_set_tile64(self, resp: Any) -> None:
+        """
+        Store zone colors from a State64 message and invalidate cached values.
+
+        A State64 message holds 64 colors, so on tiles with more zones each one
+        only updates the rows it covers.
+        """
+        geometry = self._geometry
+        if resp and (
+            resp.x
+            or resp.y
+            or resp.width != geometry.width
+            or len(resp.colors) != geometry.zone_count
+        ):
+            zones = list(self.chain.get(resp.tile_index, ()))
+            zones.extend([(0, 0, 0, 3500)] * (geometry.zone_count - len(zones)))
+            for index, color in enumerate(resp.colors):
+                column = resp.x + index % resp.width
+                row = resp.y + index // resp.width
+                if column < geometry.width and row < geometry.height:
+                    zones[row * geometry.width + column] = color
+            self.chain[resp.tile_index] = zones
+            self.chain_length = len(self.chain)
+        else:
+            super().resp_set_tile64(resp)
+        self._zone_generation += 1
+        self._zone_reads += 1
+
+    @property
+    def geometry(self) -> CeilingGeometry:
+        """Return the matrix size and uplight zones of the device."""
+        return self._geometry
+
+    @property
+    def last_sent_at(self) -> float | None:
+        """Return the perf_counter time the last acknowledged request was sent."""
+        return self._last_sent_at
+
+    async def try_sending(
+        self, msg: Any, timeout_secs: float | None, max_attempts: int | None
+    ) -> None:
+        """
+        Send a request until it is acknowledged, recording when it first went out.
+
+        aiolifx sends a request from a background task, so the time it is
+        queued is not when the datagram is written. The first attempt is sent
+        before the first await, so the time taken here is when it went out.
+        """
+        self._last_sent_at = time.perf_counter()
+        await super().try_sending(msg, timeout_secs, max_attempts)
+
+    @property
+    def zone_reads(self) -> int:
+        """Return how many State64 messages have been received from the device."""
+        return self._zone_reads
+
+    @property
+    def zone_generation(self) -> int:
+        """Return a counter that increases every time the zone colors change."""
+        return self._zone_generation
+
+    @property
+    def frame(self) -> HSBKFrame:
+        """
+        Return the zone colors last written to or reported by the device.
+
+        The frame is reloaded from chain[0] only when the device reports new
+        zone colors, so writes made since then are kept. While a local fade is
+        running the frame holds its target rather than a color on the way.
+        """
+        if self._frame_generation != self._zone_generation:
+            self._sent_frame.load(self.chain[0])
+            if self._fade is not None and self._fade.active:
+                self._frame.load_frame(self._fade.target)
+            else:
+                self._frame.load_frame(self._sent_frame)
+            self._frame_generation = self._zone_generation
+        return self._frame
+
+    @property
+    def metrics(self) -> LIFXCeilingMetrics:
+        """Return command timings and packet counts for the device."""
+        return self._metrics
+
+    @property
+    def write_queue(self) -> LIFXCeilingWriteQueue:
+        """Return the queue that delivers zone writes to the device."""
+        return self._write_queue
+
+    def queue_set64(
+        self,
+        *,
+        x: int = 0,
+        y: int = 0,
+        width: int | None = None,
+        duration: float = 0,
+        colors: Sequence[tuple[int, int, int, int]],
+    ) -> asyncio.Future[None]:
+        """
+        Queue an acknowledged set64 write to the first tile.
+
+        The returned future completes once the device acknowledges the write, or
+        a newer write replaces it, and fails if neither happens within
+        MESSAGE_TIMEOUT seconds.
+        """
+        return self._write_queue.submit(
+            x=x,
+            y=y,
+            width=self._geometry.width if width is None else width,
+            duration=duration,
+            colors=colors,
+        )
+
+    def queue_frame(
+        self, duration: float = 0, frame: HSBKFrame | None = None
+    ) -> asyncio.Future[None]:
+        """
+        Queue a write of the frame zones that changed since the last write.
+
+        The frame of the device is written unless another frame is given.
+
+        Only the smallest set64 rectangle around the changed zones is sent, such
+        as the single uplight zone, and nothing is sent when no zone changed.
+        Tiles with more than 64 zones may need several set64 writes, which are
+        queued back-to-back. After a failed write the next one sends every zone.
+        """
+        frame = self.frame if frame is None else frame
+        geometry = self._geometry
+        changed = (
+            range(geometry.zone_count)
+            if self._resend_all
+            else frame.changed_zones(self._sent_frame)
+        )
+        if not (rectangles := geometry.set64_rectangles(changed)):
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            future.set_result(None)
+            return future
+
+        self._sent_frame.load_frame(frame)
+        self._resend_all = False
+        futures = [
+            self.queue_set64(
+                x=x,
+                y=y,
+                width=width,
+                duration=duration,
+                colors=frame.rectangle(x, y, width, geometry.width),
+            )
+            for x, y, width in rectangles
+        ]
+        future = futures[0] if len(futures) == 1 else asyncio.gather(*futures)
+        future.add_done_callback(self._check_frame_write)
+        return future
+
+    @property
+    def fade_active(self) -> bool:
+        """Return if a local fade is running or paused."""
+        return self._fade is not None and self._fade.active
+
+    @property
+    def fade_diagnostics(self) -> dict[str, Any] | None:
+        """Return the diagnostics of the last local fade, if any."""
+        return None if self._fade is None else self._fade.as_dict()
+
+    def write_frame(self, duration: float = 0) -> asyncio.Future[None]:
+        """
+        Write the frame, interpolating long transitions locally.
+
+        A transition of at least LOCAL_FADE_MIN_DURATION seconds is sent as a
+        series of keyframes, starting from the colors the device has reached,
+        so it survives the device rebooting and can be paused. A long write
+        during a fade retargets it, while a short one only changes the zones it
+        touches and leaves the rest fading.
+        """
+        frame = self.frame
+        if duration < LOCAL_FADE_MIN_DURATION:
+            if self._fade is not None and self._fade.active:
+                return self._write_beside_fade(self._fade, frame, duration)
+            self.stop_fade()
+            return self.queue_frame(duration)
+
+        if self._fade is not None and self._fade.active:
+            return self._fade.retarget(frame.colors(), duration)
+        self._fade = LIFXCeilingFade(
+            self._write_keyframe, self._sent_frame.colors(), frame.colors(), duration
+        )
+        return self._fade.start()
+
+    def _write_beside_fade(
+        self, fade: LIFXCeilingFade, frame: HSBKFrame, duration: float
+    ) -> asyncio.Future[None]:
+        """
+        Write the zones a short command changed while the others keep fading.
+
+        Changed zones go straight to their new color and the fade holds them
+        there. The fade stops once none of its zones are still changing.
+        """
+        changed = fade.target.changed_zones(frame)
+        colors = frame.colors()
+        if not fade.hold_zones(changed, colors):
+            self.stop_fade()
+        keyframe = HSBKFrame(frame.zone_count).load_frame(self._sent_frame)
+        for zone in changed:
+            keyframe.set_zones(zone, colors[zone : zone + 1])
+        return self.queue_frame(duration, keyframe)
+
+    def _write_keyframe(
+        self, keyframe: HSBKFrame, duration: float
+    ) -> asyncio.Future[None]:
+        """Write a fade keyframe, logging any failure."""
+        future = self.queue_frame(duration, keyframe)
+        future.add_done_callback(self._log_write_error)
+        return future
+
+    def pause_fade(self) -> None:
+        """Hold the device at the current colors of its local fade."""
+        if self._fade is not None:
+            self._fade.pause()
+
+    def resume_fade(self) -> None:
+        """Continue a paused local fade."""
+        if self._fade is not None:
+            self._fade.resume()
+
+    def stop_fade(self) -> None:
+        """Stop the local fade, if any."""
+        if self._fade is not None:
+            self._fade.cancel()
+            self._fade = None
+
+    def _check_frame_write(self, future: asyncio.Future[None]) -> None:
+        """Send every zone next time if the device may have missed a write."""
+        if future.cancelled() or future.exception() is not None:
+            self._resend_all = True
+
+    async def _async_set_power(self, value: str, duration: int) -> None:
+        """Set the power level and record how long the acknowledgement took."""
+        started = time.perf_counter()
+        self._metrics.packets_sent += 1
+        await async_execute_lifx(
+            partial(self.set_power, value=value, duration=duration * 1000)
+        )
+        self._metrics.ack_time.record(time.perf_counter() - started)
+
+    async def async_refresh_zones(self) -> None:
+        """
+        Fetch the zone colors and power level of the device.
+
+        One Get64 request per 64 zones and one GetPower request are sent
+        together and only those without a reply are retried, which is far fewer
+        messages than a full poll by the core LIFX coordinator.
+        """
+        geometry = self._geometry
+        started = time.perf_counter()
+        await async_multi_execute_lifx_with_retries(
+            [
+                *(
+                    partial(
+                        self.req_with_resp,
+                        TileGet64,
+                        TileState64,
+                        {
+                            "tile_index": 0,
+                            "length": 1,
+                            "x": 0,
+                            "y": y,
+                            "width": geometry.width,
+                        },
+                    )
+                    for y in range(0, geometry.height, geometry.rows_per_set64)
+                ),
+                # get_power only asks the device when no power level is cached.
+                partial(self.req_with_resp, LightGetPower, LightStatePower),
+            ],
+            REFRESH_ATTEMPTS,
+            MESSAGE_TIMEOUT,
+        )
+        self._metrics.refresh_duration.record(time.perf_counter() - started)
+
+    def _store_zones(self, colors: list[tuple[int, int, int, int]]) -> None:
+        """Keep written zone colors as the known device state until the next poll."""
+        self.chain[0] = colors
+        self._zone_generation += 1
+        self._frame_generation = self._zone_generation
+
+    def _zone_aggregates(
+        self,
+    ) -> tuple[int, tuple[float, float], tuple[float, float]]:
+        """Return downlight max brightness, downlight hs and uplight hs."""
+        if self._zone_cache_generation != self._zone_generation:
+            zones = self.chain[0]
+            down_hue, down_saturation, _, _ = self._downlight_zone()
+            up_hue, up_saturation, _, _ = self._uplight_zone()
+            self._zone_cache = (
+                max(zones[index][2] for index in self._geometry.downlight_zones),
+                hs_from_16bit(down_hue, down_saturation),
+                hs_from_16bit(up_hue, up_saturation),
+            )
+            self._zone_cache_generation = self._zone_generation
+        return self._zone_cache
+
+    def _downlight_zone(self) -> tuple[int, int, int, int]:
+        """Return the color of the first downlight zone."""
+        return self.chain[0][self._geometry.downlight_zones[0]]
+
+    def _uplight_zone(self) -> tuple[int, int, int, int]:
+        """Return the color of the first uplight zone."""
+        return self.chain[0][self._geometry.uplight_zones[0]]
+
     @property
     def min_kelvin(self) -> int:
         """Return the minimum kelvin value."""
@@ -73,76 +483,82 @@ class LIFXCeiling(Light):
 
     @property
     def uplight_color(self) -> tuple[int, int, int, int]:
-        """Return the HSBK values for the last zone."""
-        hue, saturation, brightness, kelvin = self.chain[0][63]
-        if hasattr(self, "configured_uplight_brightness"):
-            brightness = min(brightness, self.configured_uplight_brightness)
-        return hue, saturation, brightness, kelvin
+        """Return the HSBK values for the uplight, or the last color when off."""
+        if self._last_uplight_color is not None and not self.uplight_is_on:
+            return self._last_uplight_color
+        hue, saturation, brightness, kelvin = self._uplight_zone()
+        return (
+            hue,
+            saturation,
+            min(brightness, self.configured_uplight_brightness),
+            kelvin,
+        )
 
     @property
     def uplight_hs_color(self) -> tuple[float, float]:
         """Return hue, saturation as a tuple."""
-        hue, saturation, _, _ = self.chain[0][63]
-        hue = hue / 65535 * 360
-        saturation = saturation / 65535 * 100
-        return hue, saturation
+        return self._zone_aggregates()[2]
 
     @property
     def uplight_brightness(self) -> int:
-        """Return uplight brightness."""
-        if (
-            hasattr(self, "uplight_is_on")
-            and not self.uplight_is_on
-            and hasattr(self, "configured_uplight_brightness")
-        ):
-            return self.configured_uplight_brightness
-        _, _, brightness, _ = self.chain[0][63]
-        return brightness >> 8
+        """Return uplight brightness (0-255), or the configured brightness when off."""
+        if not self.uplight_is_on:
+            return brightness_to_8bit(self.configured_uplight_brightness)
+        _, _, brightness, _ = self._uplight_zone()
+        return brightness_to_8bit(brightness)
 
     @property
     def uplight_kelvin(self) -> int:
         """Return uplight kelvin."""
-        _, _, _, kelvin = self.chain[0][63]
+        _, _, _, kelvin = self._uplight_zone()
         return kelvin
 
     @property
     def downlight_hs_color(self) -> tuple[float, float]:
-        """Return the hue, saturation from zone 0."""
-        hue, saturation, _, _ = self.chain[0][0]
-        hue = hue / 65535 * 360
-        saturation = saturation / 65535 * 100
-        return hue, saturation
+        """Return the hue, saturation from the first downlight zone."""
+        return self._zone_aggregates()[1]
 
     @property
     def downlight_brightness(self) -> int:
-        """Return max brightness value for all downlight zones."""
-        if (
-            hasattr(self, "downlight_is_on")
-            and not self.downlight_is_on
-            and hasattr(self, "configured_downlight_brightness")
-        ):
-            return self.configured_downlight_brightness
-        unscaled = max(brightness for _, _, brightness, _ in self.chain[0][:63])
-        return unscaled >> 8
+        """Return the max downlight zone brightness (0-255), or configured when off."""
+        if not self.downlight_is_on:
+            return brightness_to_8bit(self.configured_downlight_brightness)
+        return brightness_to_8bit(self._zone_aggregates()[0])
 
     @property
     def downlight_kelvin(self) -> int:
-        """Return kelvin from zone 0."""
-        _, _, _, kelvin = self.chain[0][0]
+        """Return kelvin from the first downlight zone."""
+        _, _, _, kelvin = self._downlight_zone()
         return kelvin
 
     @property
     def downlight_color(self) -> tuple[int, int, int, int]:
-        """Return zone 0 hue, saturation, kelvin with max brightness."""
-        brightness = max(brightness for _, _, brightness, _ in self.chain[0][:63])
-        if hasattr(self, "configured_downlight_brightness"):
-            brightness = min(brightness, self.configured_downlight_brightness)
-        hue, saturation, _, kelvin = self.chain[0][0]
+        """Return the first downlight color with max brightness, or last when off."""
+        if self._last_downlight_color is not None and not self.downlight_is_on:
+            return self._last_downlight_color
+        brightness = min(
+            self._zone_aggregates()[0], self.configured_downlight_brightness
+        )
+        hue, saturation, _, kelvin = self._downlight_zone()
         return hue, saturation, brightness, kelvin
 
+    def zone_group_color(self, group: str) -> tuple[int, int, int, int]:
+        """Return the first zone color of a zone group with its max brightness."""
+        zones = self.chain[0]
+        ranges = zone_group_ranges(self._geometry, group)
+        brightness = max(
+            zones[index][2] for start, stop in ranges for index in range(start, stop)
+        )
+        hue, saturation, _, kelvin = zones[ranges[0][0]]
+        return hue, saturation, brightness, kelvin
+
+    def zone_group_is_on(self, group: str) -> bool:
+        """Return true if the downlight is on and any zone of the group is lit."""
+        return self._is_downlight_on and self.zone_group_color(group)[2] > 0
+
     @property
     def configured_downlight_brightness(self) -> int:
-        """Return the configured downlight brightness."""
+        """Return the configured downlight brightness (0-65535)."""
         return self._configured_downlight_brightness
 
     @configured_downlight_brightness.setter
@@ -152,7 +568,7 @@ class LIFXCeiling(Light):
 
     @property
     def configured_uplight_brightness(self) -> int:
-        """Return the configured uplight brightness."""
+        """Return the configured uplight brightness (0-65535)."""
         return self._configured_uplight_brightness
 
     @configured_uplight_brightness.setter
@@ -170,34 +586,201 @@ class LIFXCeiling(Light):
         """Return true if power > 0 and downlight zones max brightness > 0."""
         return self._is_downlight_on
 
-    async def turn_uplight_on(
-        self, color: tuple[int, int, int, int], duration: int = 0
+    def _draw_sections(
+        self,
+        downlight_on: bool,
+        downlight_color: tuple[int, int, int, int] | None,
+        downlight_pattern: Sequence[tuple[int, int, int, int]] | None,
+        uplight_on: bool,
+        uplight_color: tuple[int, int, int, int] | None,
     ) -> None:
+        """Set the frame zones for the requested section state."""
+        frame = self.frame
+        geometry = self._geometry
+
+        if downlight_on and downlight_pattern is not None:
+            self._set_downlight_frame_zones(downlight_pattern)
+        elif downlight_on and downlight_color is not None:
+            for start, stop in geometry.downlight_ranges:
+                frame.fill(downlight_color, start, stop)
+        elif not downlight_on or self.power_level == 0:
+            for start, stop in geometry.downlight_ranges:
+                frame.zero_brightness(start, stop)
+
+        if uplight_on and uplight_color is not None:
+            for start, stop in geometry.uplight_ranges:
+                frame.fill(uplight_color, start, stop)
+        elif not uplight_on:
+            for start, stop in geometry.uplight_ranges:
+                frame.zero_brightness(start, stop)
+
+    def _draw_zone_groups(
+        self,
+        zone_groups: Mapping[str, tuple[int, int, int, int] | None],
+        downlight_on: bool,
+    ) -> bool:
         """
-        Turn the uplight on.
+        Set the frame zones of each zone group over the downlight.
 
-        Color is a tuple of hue, saturation, brightness and kelvin values (0-65535).
-        Duration is time in milliseconds to transition from current state to color.
+        Returns whether the downlight is still on, as turning off the last lit
+        zone group turns the downlight off.
+        """
+        if not zone_groups:
+            return downlight_on
+
+        frame = self.frame
+        for group, color in zone_groups.items():
+            for start, stop in zone_group_ranges(self._geometry, group):
+                if color is None:
+                    frame.zero_brightness(start, stop)
+                else:
+                    frame.fill(color, start, stop)
+        return any(
+            frame.max_brightness(start, stop) > 0
+            for start, stop in self._geometry.downlight_ranges
+        )
+
+    def section_frame(
+        self,
+        downlight_color: tuple[int, int, int, int],
+        uplight_color: tuple[int, int, int, int],
+    ) -> HSBKFrame:
+        """Return the frame with every downlight and uplight zone set to a color."""
+        frame = self.frame
+        for start, stop in self._geometry.downlight_ranges:
+            frame.fill(downlight_color, start, stop)
+        for start, stop in self._geometry.uplight_ranges:
+            frame.fill(uplight_color, start, stop)
+        return frame
+
+    def _set_downlight_frame_zones(
+        self, colors: Sequence[tuple[int, int, int, int]]
+    ) -> None:
+        """Set the downlight zones of the frame to one color each, in zone order."""
+        frame = self.frame
+        offset = 0
+        for start, stop in self._geometry.downlight_ranges:
+            frame.set_zones(start, colors[offset : offset + stop - start])
+            offset += stop - start
+
+    def set_downlight_zones(
+        self, colors: Sequence[tuple[int, int, int, int]], duration: int = 0
+    ) -> None:
+        """
+        Write a color to each downlight zone, keeping the uplight unchanged.
+
+        This is a write of the changed zones without any power or state changes,
+        intended for effect frames sent while the downlight is already on.
         """
-        hue, saturation, uplight_brightness, kelvin = color
-        self._configured_uplight_brightness = uplight_brightness
-        color = (hue, saturation, uplight_brightness, kelvin)
+        self._set_downlight_frame_zones(colors)
+        self.queue_frame(duration).add_done_callback(self._log_write_error)
+
+    def _log_write_error(self, future: asyncio.Future[None]) -> None:
+        """Log a failed zone write that nothing is waiting for."""
+        if not future.cancelled() and (err := future.exception()) is not None:
+            _LOGGER.debug("Unable to write zones to %s: %s", self.mac_addr, err)
 
-        if self.power_level > 0:
-            # The device is already on, just change the color of the uplight.
-            self.set64(
-                tile_index=0, x=7, y=7, width=8, duration=duration, colors=[color]
+    async def async_apply_sections(  # noqa: PLR0913
+        self,
+        *,
+        downlight_on: bool | None = None,
+        downlight_color: tuple[int, int, int, int] | None = None,
+        downlight_pattern: Sequence[tuple[int, int, int, int]] | None = None,
+        uplight_on: bool | None = None,
+        uplight_color: tuple[int, int, int, int] | None = None,
+        zone_groups: Mapping[str, tuple[int, int, int, int] | None] | None = None,
+        duration: int = 0,
+    ) -> None:
+        """
+        Apply uplight and downlight changes with a single write of the changed zones.
+
+        A section with an on value of None is left unchanged. Colors are tuples of
+        hue, saturation, brightness and kelvin values (0-65535) and are only used
+        when the matching section is being turned on. A downlight pattern has one
+        color per downlight zone and takes precedence over the downlight color.
+        Zone groups map a group name to its color, or None to turn it off, and
+        are applied after the downlight. Duration is the time in seconds to
+        transition from current state to color.
+        """
+        device_on = self.power_level > 0
+
+        if downlight_on is None:
+            downlight_on = device_on and self.downlight_is_on
+        elif downlight_on and downlight_pattern is not None:
+            self._configured_downlight_brightness = max(
+                brightness for _, _, brightness, _ in downlight_pattern
+            )
+        elif downlight_on and downlight_color is not None:
+            self._configured_downlight_brightness = downlight_color[2]
+        elif not downlight_on and device_on and self.downlight_is_on:
+            self._configured_downlight_brightness = self._zone_aggregates()[0]
+
+        if uplight_on is None:
+            uplight_on = device_on and self.uplight_is_on
+        elif uplight_on and uplight_color is not None:
+            self._configured_uplight_brightness = uplight_color[2]
+        elif not uplight_on and device_on and self.uplight_is_on:
+            self._configured_uplight_brightness = self._uplight_zone()[2]
+
+        zone_groups = zone_groups or {}
+        # A zone group is part of the downlight, so lighting one turns it on.
+        downlight_on = downlight_on or any(
+            color is not None for color in zone_groups.values()
+        )
+        if downlight_on or uplight_on:
+            self._draw_sections(
+                downlight_on,
+                downlight_color,
+                downlight_pattern,
+                uplight_on,
+                uplight_color,
             )
+            downlight_on = self._draw_zone_groups(zone_groups, downlight_on)
+
+        if not downlight_on and not uplight_on:
+            self.stop_fade()
+            await self._async_set_power("off", duration)
+        elif device_on:
+            colors = self.frame.colors()
+            await self.write_frame(duration)
+            self._store_zones(colors)
         else:
-            # The device is off, so set the downlight brightess to 0 first.
-            colors = [(h, s, 0, k) for h, s, _, k in self.chain[0][:63]]
-            colors.append(color)
+            colors = self.frame.colors()
+            await self._async_power_on(duration)
+            self._store_zones(colors)
+            self.power_level = 65535
+
+        self._is_downlight_on = downlight_on
+        self._is_uplight_on = uplight_on
+
+    async def _async_power_on(self, duration: int) -> None:
+        """Set the zones of a device that is off, then turn it on."""
+        if duration < LOCAL_FADE_MIN_DURATION:
+            self.stop_fade()
+            await self.queue_frame()
+            await self._async_set_power("on", duration)
+            return
+
+        # Turn on dark and fade in locally, rather than from the colors that
+        # were showing when the device was turned off.
+        self.stop_fade()
+        dark = HSBKFrame(self.frame.zone_count).load_frame(self.frame)
+        await self.queue_frame(frame=dark.zero_brightness())
+        await self._async_set_power("on", 0)
+        await self.write_frame(duration)
 
-            self.set64(tile_index=0, x=0, y=0, width=8, duration=0, colors=colors)
-            await async_execute_lifx(
-                partial(self.set_power, value="on", duration=duration * 1000)
-            )
-        self._is_uplight_on = True
+    async def turn_uplight_on(
+        self, color: tuple[int, int, int, int], duration: int = 0
+    ) -> None:
+        """
+        Turn the uplight on.
+
+        Color is a tuple of hue, saturation, brightness and kelvin values (0-65535).
+        Duration is the time in seconds to transition from current state to color.
+        """
+        await self.async_apply_sections(
+            uplight_on=True, uplight_color=color, duration=duration
+        )
 
     async def turn_uplight_off(self, duration: int = 0) -> None:
         """
@@ -206,22 +789,7 @@ class LIFXCeiling(Light):
         If the downlight is on, lower the brightness of the uplight to zero.
         If the downlight is off, turn off the entire light.
         """
-        if self.downlight_is_on is True:
-            hue, saturation, current_brightness, kelvin = self.chain[0][63]
-            self._configured_uplight_brightness = current_brightness
-            self.set64(
-                tile_index=0,
-                x=7,
-                y=7,
-                width=8,
-                duration=duration,
-                colors=[(hue, saturation, 0, kelvin)],
-            )
-        else:
-            await async_execute_lifx(
-                partial(self.set_power, value="off", duration=duration * 1000)
-            )
-        self._is_uplight_on = False
+        await self.async_apply_sections(uplight_on=False, duration=duration)
 
     async def turn_downlight_on(
         self, color: tuple[int, int, int, int], duration: int = 0
@@ -230,27 +798,11 @@ class LIFXCeiling(Light):
         Turn the downlight on.
 
         Color is a tuple of hue, saturation, brightness and kelvin values (0-65535).
-        Duration is the time in milliseconds to transition from current state to color.
+        Duration is the time in seconds to transition from current state to color.
         """
-        hue, saturation, downlight_brightness, kelvin = color
-        self._configured_downlight_brightness = downlight_brightness
-        color = (hue, saturation, downlight_brightness, kelvin)
-        colors = [color] * 63
-
-        if self.power_level > 0:
-            colors.append(self.chain[0][63])
-            self.set64(
-                tile_index=0, x=0, y=0, width=8, duration=duration, colors=colors
-            )
-        else:
-            hue, saturation, _, kelvin = self.chain[0][63]
-            colors.append((hue, saturation, 0, kelvin))
-
-            self.set64(tile_index=0, x=0, y=0, width=8, duration=0, colors=colors)
-            await async_execute_lifx(
-                partial(self.set_power, value="on", duration=duration * 1000)
-            )
-        self._is_downlight_on = True
+        await self.async_apply_sections(
+            downlight_on=True, downlight_color=color, duration=duration
+        )
 
     async def turn_downlight_off(self, duration: int = 0) -> None:
         """
@@ -259,20 +811,4 @@ class LIFXCeiling(Light):
         If the uplight is on, lower the downlight brightness to zero.
         If the uplight is off, turn off the entire device.
         """
-        if self.uplight_is_on:
-            self.configured_downlight_brightness = self.downlight_brightness
-            colors = [(h, s, 0, k) for h, s, _, k in self.chain[0][:63]]
-            colors.append(self.chain[0][63])
-            self.set64(
-                tile_index=0,
-                x=0,
-                y=0,
-                width=8,
-                duration=duration,
-                colors=colors,
-            )
-        else:
-            await async_execute_lifx(
-                partial(self.set_power, value="off", duration=duration * 1000)
-            )
-        self._is_downlight_on = False
+        await self.async_apply_sections(downlight_on=False, duration=duration)
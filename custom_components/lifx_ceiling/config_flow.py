@@ -2,15 +2,62 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import voluptuous as vol
+from homeassistant.core import callback
 from homeassistant.helpers import config_entry_flow
+from homeassistant.helpers.schema_config_entry_flow import (
+    SchemaFlowError,
+    SchemaFlowFormStep,
+    SchemaOptionsFlowHandler,
+)
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+)
 
-from .const import DOMAIN, NAME
+from .const import (
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_ZONE_GROUPS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DOMAIN,
+    NAME,
+    ZONE_GROUPS,
+)
 from .util import find_lifx_coordinators
 
 if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry, OptionsFlow
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.schema_config_entry_flow import SchemaCommonFlowHandler
+
+POLL_INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=1, max=300, step=1, unit_of_measurement="s", mode=NumberSelectorMode.BOX
+    )
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_MIN_POLL_INTERVAL, default=DEFAULT_MIN_POLL_INTERVAL
+        ): POLL_INTERVAL_SELECTOR,
+        vol.Required(
+            CONF_MAX_POLL_INTERVAL, default=DEFAULT_MAX_POLL_INTERVAL
+        ): POLL_INTERVAL_SELECTOR,
+        vol.Optional(CONF_ZONE_GROUPS, default=[]): SelectSelector(
+            SelectSelectorConfig(
+                options=ZONE_GROUPS, multiple=True, translation_key=CONF_ZONE_GROUPS
+            )
+        ),
+    }
+)
 
 
 async def _async_has_devices(hass: HomeAssistant) -> bool:
@@ -20,4 +67,36 @@ async def _async_has_devices(hass: HomeAssistant) -> bool:
     return len(coordinators) > 0
 
 
-config_entry_flow.register_discovery_flow(DOMAIN, NAME, _async_has_devices)
+async def _async_validate_options(
+    _handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Check the fastest poll interval is not slower than the slowest."""
+    if user_input[CONF_MIN_POLL_INTERVAL] > user_input[CONF_MAX_POLL_INTERVAL]:
+        msg = "min_poll_interval_above_max"
+        raise SchemaFlowError(msg)
+    return user_input
+
+
+OPTIONS_FLOW = {
+    "init": SchemaFlowFormStep(
+        OPTIONS_SCHEMA, validate_user_input=_async_validate_options
+    ),
+}
+
+
+class LIFXCeilingConfigFlow(
+    config_entry_flow.DiscoveryFlowHandler[bool], domain=DOMAIN
+):
+    """Set up LIFX Ceiling once LIFX devices have been found."""
+
+    VERSION = 1
+
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        super().__init__(DOMAIN, NAME, _async_has_devices)
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow for the poll intervals."""
+        return SchemaOptionsFlowHandler(config_entry, OPTIONS_FLOW)
@@ -3,6 +3,14 @@
 from datetime import timedelta
 from logging import Logger, getLogger
 
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+)
+
 _LOGGER: Logger = getLogger(__package__)
 
 ATTR_DOWNLIGHT_HUE = "downlight_hue"
@@ -15,11 +23,56 @@ ATTR_UPLIGHT_SATURATION = "uplight_saturation"
 ATTR_UPLIGHT_BRIGHTNESS = "uplight_brightness"
 ATTR_UPLIGHT_KELVIN = "uplight_kelvin"
 
+ATTR_PATTERN = "pattern"
+ATTR_START_COLOR = "start_color"
+ATTR_END_COLOR = "end_color"
+ATTR_ANGLE = "angle"
+ATTR_IMAGE = "image"
+ATTR_KELVIN = "kelvin"
+
+PATTERN_RADIAL_GRADIENT = "radial_gradient"
+PATTERN_LINEAR_GRADIENT = "linear_gradient"
+PATTERN_IMAGE = "image"
+PATTERNS = [PATTERN_RADIAL_GRADIENT, PATTERN_LINEAR_GRADIENT, PATTERN_IMAGE]
+
+ATTR_EFFECT = "effect"
+ATTR_COLORS = "colors"
+ATTR_THEME = "theme"
+ATTR_PERIOD = "period"
+ATTR_FPS = "fps"
+
+EFFECT_FADE = "fade"
+EFFECT_PULSE = "pulse"
+EFFECT_FLAME = "flame"
+EFFECT_THEME = "theme"
+EFFECTS = [EFFECT_FADE, EFFECT_PULSE, EFFECT_FLAME, EFFECT_THEME]
+
+# Frames per second an effect can send without flooding the device
+EFFECT_MAX_FPS = 20
+
+ZONE_GROUP_INNER_RING = "inner_ring"
+ZONE_GROUP_OUTER_RING = "outer_ring"
+ZONE_GROUP_TOP_LEFT = "top_left"
+ZONE_GROUP_TOP_RIGHT = "top_right"
+ZONE_GROUP_BOTTOM_LEFT = "bottom_left"
+ZONE_GROUP_BOTTOM_RIGHT = "bottom_right"
+ZONE_GROUPS = [
+    ZONE_GROUP_INNER_RING,
+    ZONE_GROUP_OUTER_RING,
+    ZONE_GROUP_TOP_LEFT,
+    ZONE_GROUP_TOP_RIGHT,
+    ZONE_GROUP_BOTTOM_LEFT,
+    ZONE_GROUP_BOTTOM_RIGHT,
+]
+
 ATTR_UPLIGHT = "uplight"
 ATTR_POWER = "power"
 ATTR_DOWNLIGHT = "downlight"
 
 CONF_SERIAL = "serial"
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_ZONE_GROUPS = "zone_groups"
 
 DOMAIN = "lifx_ceiling"
 NAME = "LIFX Ceiling"
@@ -29,8 +82,65 @@ HSBK_SATURATION = 1
 HSBK_BRIGHTNESS = 2
 HSBK_KELVIN = 3
 
-DISCOVERY_INTERVAL = timedelta(minutes=5)
+# New devices are found when core LIFX entries load, this is only a fallback
+DISCOVERY_INTERVAL = timedelta(minutes=30)
+
+# Seconds between discovery runs triggered by config entry or registry changes
+DISCOVERY_COOLDOWN = 2
+
+# Number of discovery events kept for diagnostics
+DISCOVERY_HISTORY_SIZE = 50
+
+# Seconds to wait for other uplight/downlight commands before writing to a device
+COMMAND_BATCH_WINDOW = 0.05
+
+# Seconds after a command and its transition before polling to confirm the state
+STATE_CHECK_DELAY = 2
+
+# Transitions of at least this many seconds are interpolated locally
+LOCAL_FADE_MIN_DURATION = 30
+
+# Largest change between fade keyframes, in perceptual units from 0 to 100
+FADE_KEYFRAME_STEP = 2
+
+# Fewest and most seconds between fade keyframes, however fast the change is
+FADE_MIN_KEYFRAME_INTERVAL = 0.5
+FADE_MAX_KEYFRAME_INTERVAL = 10
+
+# Seconds to batch changes to remembered device state before writing them to disk
+STORAGE_SAVE_DELAY = 10
+
+# Seconds between polls right after a command or a change made elsewhere, which
+# matches the core LIFX integration's own poll interval
+DEFAULT_MIN_POLL_INTERVAL = 10
+
+# Seconds between polls once nothing has changed for a while
+DEFAULT_MAX_POLL_INTERVAL = 60
 
 SERVICE_LIFX_CEILING_SET_STATE = "set_state"
+SERVICE_LIFX_CEILING_SET_DOWNLIGHT_PATTERN = "set_downlight_pattern"
+SERVICE_LIFX_CEILING_START_EFFECT = "start_effect"
+SERVICE_LIFX_CEILING_STOP_EFFECT = "stop_effect"
+SERVICE_LIFX_CEILING_PAUSE_FADE = "pause_fade"
+SERVICE_LIFX_CEILING_RESUME_FADE = "resume_fade"
+
+# Sent with the new device, or None, when a device is re-adopted or dropped
+SIGNAL_DEVICE_CHANGED = f"{DOMAIN}_device_changed_{{}}"
+
+# Maximum number of devices a service call other than set_state updates at the
+# same time. set_state sends to every device in a single burst instead.
+SERVICE_MAX_PARALLEL = 10
+
+# Service call fields that can target devices, directly or through the registries
+TARGET_ATTRS = (
+    ATTR_ENTITY_ID,
+    ATTR_DEVICE_ID,
+    ATTR_AREA_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+)
+
+# Number of distinct service call targets kept resolved between registry changes
+TARGET_CACHE_SIZE = 32
 
 RUNTIME_DATA_HASS_VERSION = "2025.7.0"
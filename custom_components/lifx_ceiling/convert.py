@@ -0,0 +1,106 @@
+"""Conversions between Home Assistant color values and LIFX HSBK values."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import homeassistant.util.color as color_util
+
+# 16-bit LIFX brightness for each 8-bit Home Assistant brightness, so that
+# 0 maps to 0 and 255 maps to 65535 and shifting right by 8 gives it back.
+BRIGHTNESS_TO_16BIT: tuple[int, ...] = tuple(
+    (brightness << 8) | brightness for brightness in range(256)
+)
+
+# CIE constants where lightness switches from a linear to a cube root curve.
+CIE_EPSILON = 216 / 24389
+CIE_KAPPA = 24389 / 27
+
+# Coolest and warmest color temperatures of a LIFX Ceiling.
+MIN_KELVIN = 1500
+MAX_KELVIN = 9000
+
+
+def brightness_to_16bit(brightness: int) -> int:
+    """Return the LIFX brightness for a Home Assistant brightness (0-255)."""
+    return BRIGHTNESS_TO_16BIT[brightness]
+
+
+def brightness_to_8bit(brightness: int) -> int:
+    """Return the Home Assistant brightness for a LIFX brightness (0-65535)."""
+    return brightness >> 8
+
+
+def percent_to_16bit(percent: float) -> int:
+    """Return a LIFX saturation or brightness for a percentage."""
+    return round(percent * 655.35)
+
+
+def percent_to_brightness_16bit(percent: float) -> int:
+    """Return the LIFX brightness for a Home Assistant brightness percentage."""
+    return BRIGHTNESS_TO_16BIT[round(percent * 2.55)]
+
+
+def hue_to_16bit(hue: float) -> int:
+    """Return the LIFX hue for a hue in degrees."""
+    return round(hue * 65535 / 360) % 65536
+
+
+def hue_to_degrees(hue: int) -> float:
+    """Return the hue in degrees for a LIFX hue."""
+    return hue / 65535 * 360
+
+
+def saturation_to_percent(saturation: int) -> float:
+    """Return the saturation percentage for a LIFX saturation."""
+    return saturation / 65535 * 100
+
+
+def hs_to_16bit(hs_color: tuple[float, float]) -> tuple[int, int]:
+    """Return the LIFX hue and saturation for a Home Assistant hs color."""
+    hue, saturation = hs_color
+    return hue_to_16bit(hue), percent_to_16bit(saturation)
+
+
+def hs_from_16bit(hue: int, saturation: int) -> tuple[float, float]:
+    """Return the Home Assistant hs color for a LIFX hue and saturation."""
+    return hue_to_degrees(hue), saturation_to_percent(saturation)
+
+
+@lru_cache(maxsize=256)
+def color_name_to_16bit(color_name: str) -> tuple[int, int]:
+    """
+    Return the LIFX hue and saturation of a named color.
+
+    Raises ValueError for an unknown color name.
+    """
+    return hs_to_16bit(
+        color_util.color_RGB_to_hs(*color_util.color_name_to_rgb(color_name))
+    )
+
+
+def brightness_to_lightness(brightness: int) -> float:
+    """Return the CIE lightness (0-100) of a LIFX brightness taken as luminance."""
+    luminance = brightness / 65535
+    if luminance <= CIE_EPSILON:
+        return luminance * CIE_KAPPA
+    return 116 * luminance ** (1 / 3) - 16
+
+
+def lightness_to_brightness(lightness: float) -> int:
+    """Return the LIFX brightness for a CIE lightness (0-100)."""
+    if lightness <= CIE_EPSILON * CIE_KAPPA:
+        luminance = lightness / CIE_KAPPA
+    else:
+        luminance = ((lightness + 16) / 116) ** 3
+    return min(65535, max(0, round(luminance * 65535)))
+
+
+def kelvin_to_mired(kelvin: int) -> float:
+    """Return the mired value of a color temperature."""
+    return 1_000_000 / min(max(kelvin, MIN_KELVIN), MAX_KELVIN)
+
+
+def mired_to_kelvin(mired: float) -> int:
+    """Return the color temperature of a mired value."""
+    return round(1_000_000 / mired)
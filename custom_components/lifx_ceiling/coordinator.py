@@ -2,44 +2,161 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from awesomeversion import AwesomeVersion
+from homeassistant.components.lifx.const import DOMAIN as LIFX_DOMAIN
 from homeassistant.components.lifx.util import async_execute_lifx
-from homeassistant.components.light import ATTR_TRANSITION
-from homeassistant.const import ATTR_DEVICE_ID, MAJOR_VERSION, MINOR_VERSION
+from homeassistant.components.light import ATTR_BRIGHTNESS_PCT, ATTR_TRANSITION
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
+from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
+    ATTR_FLOOR_ID,
+    ATTR_LABEL_ID,
+    ENTITY_MATCH_NONE,
+    MAJOR_VERSION,
+    MINOR_VERSION,
+)
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import floor_registry as fr
+from homeassistant.helpers import label_registry as lr
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .api import LIFXCeiling
+from .api import LIFXCeiling, LIFXCeilingError
 from .const import (
     _LOGGER,
+    ATTR_ANGLE,
+    ATTR_COLORS,
     ATTR_DOWNLIGHT_BRIGHTNESS,
     ATTR_DOWNLIGHT_HUE,
     ATTR_DOWNLIGHT_KELVIN,
     ATTR_DOWNLIGHT_SATURATION,
+    ATTR_EFFECT,
+    ATTR_END_COLOR,
+    ATTR_FPS,
+    ATTR_IMAGE,
+    ATTR_KELVIN,
+    ATTR_PATTERN,
+    ATTR_PERIOD,
+    ATTR_START_COLOR,
+    ATTR_THEME,
     ATTR_UPLIGHT_BRIGHTNESS,
     ATTR_UPLIGHT_HUE,
     ATTR_UPLIGHT_KELVIN,
     ATTR_UPLIGHT_SATURATION,
+    COMMAND_BATCH_WINDOW,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DISCOVERY_COOLDOWN,
+    DISCOVERY_HISTORY_SIZE,
     DOMAIN,
+    EFFECT_FADE,
+    EFFECT_FLAME,
+    EFFECT_PULSE,
+    PATTERN_IMAGE,
+    PATTERN_RADIAL_GRADIENT,
+    SERVICE_MAX_PARALLEL,
+    SIGNAL_DEVICE_CHANGED,
+    STATE_CHECK_DELAY,
+    TARGET_ATTRS,
+    TARGET_CACHE_SIZE,
 )
+from .convert import hue_to_16bit, percent_to_16bit
+from .effects import (
+    FadeEffect,
+    FlameEffect,
+    LIFXCeilingEffect,
+    LIFXCeilingEffectRunner,
+    PulseEffect,
+    ThemeEffect,
+)
+from .patterns import hsbk_from_rgb, image_pattern, linear_gradient, radial_gradient
+from .store import LIFXCeilingStore
 from .util import find_lifx_coordinators
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable, Sequence
     from datetime import datetime
 
     from homeassistant.components.lifx.coordinator import LIFXUpdateCoordinator
-    from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant, ServiceCall
+    from homeassistant.config_entries import ConfigEntry, ConfigEntryChange
+    from homeassistant.core import (
+        CALLBACK_TYPE,
+        Event,
+        HomeAssistant,
+        ServiceCall,
+        ServiceResponse,
+    )
+
+    from .frame import HSBKFrame
+    from .geometry import CeilingGeometry
 
 
 type LIFXCeilingConfigEntry = ConfigEntry[LIFXCeilingUpdateCoordinator]
 
 
+@dataclass(slots=True)
+class _PendingCommand:
+    """Uplight and downlight changes waiting to be written to a device."""
+
+    done: asyncio.Future[None]
+    downlight_on: bool | None = None
+    downlight_color: tuple[int, int, int, int] | None = None
+    downlight_pattern: Sequence[tuple[int, int, int, int]] | None = None
+    uplight_on: bool | None = None
+    uplight_color: tuple[int, int, int, int] | None = None
+    zone_groups: dict[str, tuple[int, int, int, int] | None] = field(
+        default_factory=dict
+    )
+    duration: int = 0
+    cancel_flush: CALLBACK_TYPE | None = field(default=None, repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class _ResolvedTarget:
+    """The registry IDs a service call target resolved to."""
+
+    # Devices named directly or through one of their entities, and entities
+    # without a device. These are reported as failed when not a LIFX Ceiling.
+    explicit: tuple[str, ...]
+    # Devices found through an area, floor or label, which are skipped when
+    # they are not a LIFX Ceiling.
+    indirect: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class _AdaptivePoll:
+    """The original poll interval of a core coordinator and the state it last saw."""
+
+    original_interval: timedelta | None
+    remove_listener: CALLBACK_TYPE
+    zone_reads: int = 0
+    power_level: int | None = None
+    zones: list[tuple[int, int, int, int]] = field(default_factory=list)
+
+
 class LIFXCeilingUpdateCoordinator(DataUpdateCoordinator[list[LIFXCeiling]]):
     """LIFX Ceiling data update coordinator."""
 
@@ -62,6 +179,26 @@ class LIFXCeilingUpdateCoordinator(DataUpdateCoordinator[list[LIFXCeiling]]):
         self._discovery_callback: Callable[[LIFXCeiling], None] | None = None
         self._ceiling_coordinators: dict[str, LIFXUpdateCoordinator] = {}
         self._ceilings: set[LIFXCeiling] = set()
+        self._pending_commands: dict[str, _PendingCommand] = {}
+        self._device_index: dict[str, LIFXCeiling] = {}
+        self._target_cache: dict[tuple[frozenset[str], ...], _ResolvedTarget] = {}
+        self._effects: dict[str, LIFXCeilingEffectRunner] = {}
+        self._state_checks: dict[str, CALLBACK_TYPE] = {}
+        self._adaptive_polls: dict[str, _AdaptivePoll] = {}
+        self._store = LIFXCeilingStore(hass)
+        self._discovery_history: deque[tuple[float, str, str | None]] = deque(
+            maxlen=DISCOVERY_HISTORY_SIZE
+        )
+        self._core_listeners: dict[
+            str, dict[Callable[[], None], CALLBACK_TYPE | None]
+        ] = {}
+        self._discovery_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DISCOVERY_COOLDOWN,
+            immediate=True,
+            function=self.async_update,
+        )
         self._hass_version = AwesomeVersion(f"{MAJOR_VERSION}.{MINOR_VERSION}")
 
     @property
@@ -69,6 +206,11 @@ class LIFXCeilingUpdateCoordinator(DataUpdateCoordinator[list[LIFXCeiling]]):
         """Return a list of instantiated LIFX Ceiling devices."""
         return list(self._ceilings)
 
+    @property
+    def discovery_history(self) -> list[tuple[float, str, str | None]]:
+        """Return recent discovery runs, adoptions and drops, oldest first."""
+        return list(self._discovery_history)
+
     @property
     def discovery_callback(self) -> Callable[[LIFXCeiling], None] | None:
         """Return the discovery callback for the LIFX Ceiling Finder."""
@@ -77,171 +219,927 @@ class LIFXCeilingUpdateCoordinator(DataUpdateCoordinator[list[LIFXCeiling]]):
     @callback
     def set_discovery_callback(
         self, callback: Callable[[LIFXCeiling], None]
-    ) -> Callable[[LIFXCeiling], None]:
+    ) -> Callable[[LIFXCeiling], None] | None:
         """Set the discovery callback for the LIFX Ceiling Finder."""
         old_callback = self._discovery_callback
         self._discovery_callback = callback
         return old_callback
 
-    def async_add_core_listener(
-        self, device: LIFXCeiling, callback: Callable[[], None]
+    @callback
+    def async_start(self) -> None:
+        """Start tracking config entry and device registry changes."""
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+            )
+        )
+        for event_type in (
+            ar.EVENT_AREA_REGISTRY_UPDATED,
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            fr.EVENT_FLOOR_REGISTRY_UPDATED,
+            lr.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            self.config_entry.async_on_unload(
+                self.hass.bus.async_listen(event_type, self._async_clear_target_cache)
+            )
+        self.config_entry.async_on_unload(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed
+            )
+        )
+        self.config_entry.async_on_unload(self._discovery_debouncer.async_shutdown)
+        self.config_entry.async_on_unload(self._async_stop_all_effects)
+        self.config_entry.async_on_unload(self._async_stop_all_fades)
+        self.config_entry.async_on_unload(self._async_cancel_state_checks)
+        self.config_entry.async_on_unload(self._async_cancel_pending_commands)
+        self.config_entry.async_on_unload(self._async_stop_all_adaptive_polling)
+
+    async def async_load_stored_state(self) -> None:
+        """Load the remembered state of devices so it is ready when they are adopted."""
+        await self._store.async_load()
+
+    @callback
+    def async_schedule_discovery(self) -> None:
+        """Look for new LIFX Ceiling devices as soon as possible."""
+        self._discovery_debouncer.async_schedule_call()
+
+    @callback
+    def _async_config_entry_changed(
+        self, change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        """Sync devices when a core LIFX config entry is loaded or unloaded."""
+        if entry.domain == LIFX_DOMAIN:
+            self.async_schedule_discovery()
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
     ) -> None:
-        """Set the update listener for the LIFX Ceiling Finder."""
-        self._ceiling_coordinators[device.mac_addr].async_add_listener(callback)
+        """Keep the device index in sync with the device registry."""
+        self._target_cache.clear()
+        device_id = event.data["device_id"]
+        if event.data["action"] == "remove":
+            self._device_index.pop(device_id, None)
+            return
+
+        device_entry = dr.async_get(self.hass).async_get(device_id)
+        if device_entry is None:
+            return
+
+        self._async_index_device_entry(device_entry)
+        if event.data["action"] == "create" and any(
+            domain == LIFX_DOMAIN for domain, _ in device_entry.identifiers
+        ):
+            self.async_schedule_discovery()
+
+    @callback
+    def _async_index_device_entry(self, device_entry: dr.DeviceEntry) -> None:
+        """Add or remove a device registry entry from the device index."""
+        for domain, identifier in device_entry.identifiers:
+            if domain == DOMAIN and identifier in self._ceiling_coordinators:
+                device = self._ceiling_coordinators[identifier].device
+                if isinstance(device, LIFXCeiling):
+                    self._device_index[device_entry.id] = device
+                    return
+
+        self._device_index.pop(device_entry.id, None)
+
+    @callback
+    def _async_clear_target_cache(self, _: Event[Any]) -> None:
+        """Forget resolved service targets after a registry change."""
+        self._target_cache.clear()
+
+    @callback
+    def _async_target_device_ids(self, call: ServiceCall) -> list[str]:
+        """
+        Return the device IDs a service call targets.
+
+        Targets are resolved through the registries once and reused until one of
+        the registries changes. Only the check against the device index is done
+        on every call, so devices adopted or dropped since are still handled.
+        Raises if the target does not include any device.
+        """
+        key = tuple(
+            frozenset(cv.ensure_list(call.data.get(attr))) for attr in TARGET_ATTRS
+        )
+        if (target := self._target_cache.get(key)) is None:
+            if len(self._target_cache) >= TARGET_CACHE_SIZE:
+                del self._target_cache[next(iter(self._target_cache))]
+            target = self._target_cache[key] = self._resolve_target(call)
+
+        device_ids = [
+            *target.explicit,
+            *(
+                device_id
+                for device_id in target.indirect
+                if device_id in self._device_index
+            ),
+        ]
+        if not device_ids:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="no_devices_targeted",
+            )
+        return device_ids
+
+    def _resolve_target(self, call: ServiceCall) -> _ResolvedTarget:
+        """Resolve the devices, entities, areas, floors and labels of a call."""
+        explicit = dict.fromkeys(
+            device_id
+            for device_id in cv.ensure_list(call.data.get(ATTR_DEVICE_ID))
+            if device_id != ENTITY_MATCH_NONE
+        )
+        entity_ids = [
+            entity_id
+            for entity_id in cv.ensure_list(call.data.get(ATTR_ENTITY_ID))
+            if entity_id != ENTITY_MATCH_NONE
+        ]
+        has_indirect = any(
+            _has_target(call.data.get(attr))
+            for attr in (ATTR_AREA_ID, ATTR_FLOOR_ID, ATTR_LABEL_ID)
+        )
+        if not entity_ids and not has_indirect:
+            # Only device targets, so the registries are not needed.
+            return _ResolvedTarget(explicit=tuple(explicit), indirect=())
+
+        entity_registry = er.async_get(self.hass)
+        indirect: dict[str, None] = {}
+        for entity_id in entity_ids:
+            entity_entry = entity_registry.async_get(entity_id)
+            if entity_entry is None or entity_entry.device_id is None:
+                explicit[entity_id] = None
+            else:
+                explicit[entity_entry.device_id] = None
+
+        if has_indirect:
+            # Group entities are not expanded as their members are not tracked
+            # by the registries, so they would go stale in the cache.
+            selected = async_extract_referenced_entity_ids(
+                self.hass, call, expand_group=False
+            )
+            indirect.update(dict.fromkeys(selected.referenced_devices))
+            for entity_id in selected.indirectly_referenced:
+                if (
+                    entity_entry := entity_registry.async_get(entity_id)
+                ) is not None and entity_entry.device_id is not None:
+                    indirect[entity_entry.device_id] = None
+
+        return _ResolvedTarget(
+            explicit=tuple(explicit),
+            indirect=tuple(
+                device_id for device_id in indirect if device_id not in explicit
+            ),
+        )
+
+    @callback
+    def async_add_core_listener(
+        self, device: LIFXCeiling, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """
+        Add an update listener to the core LIFX coordinator of a device.
+
+        The listener follows the device if it is re-adopted from a new core
+        coordinator after the core LIFX config entry reloads.
+        """
+        listeners = self._core_listeners.setdefault(device.mac_addr, {})
+        core_coordinator = self._ceiling_coordinators.get(device.mac_addr)
+        listeners[update_callback] = (
+            core_coordinator.async_add_listener(update_callback)
+            if core_coordinator is not None
+            else None
+        )
+
+        @callback
+        def _async_remove_listener() -> None:
+            if (remove_listener := listeners.pop(update_callback, None)) is not None:
+                remove_listener()
+
+        return _async_remove_listener
 
     async def async_update(self, update_time: datetime | None = None) -> None:
-        """Fetch new LIFX Ceiling coordinators from the core integration."""
+        """Sync LIFX Ceiling devices with the core integration's coordinators."""
         _LOGGER.debug("Looking for new LIFX Ceiling devices")
 
-        lifx_coordinators = [
-            coordinator
+        lifx_coordinators = {
+            coordinator.device.mac_addr: coordinator
             for coordinator in find_lifx_coordinators(self.hass)
-            if coordinator.device.mac_addr not in self._ceiling_coordinators
-        ]
+        }
+        self._discovery_history.append((time.time(), "scan", None))
+
+        for mac_addr, coordinator in list(self._ceiling_coordinators.items()):
+            if lifx_coordinators.get(mac_addr) is not coordinator:
+                self._async_remove_ceiling(mac_addr)
+
+        device_registry = dr.async_get(self.hass)
+        for mac_addr, coordinator in lifx_coordinators.items():
+            if mac_addr not in self._ceiling_coordinators:
+                self._async_add_ceiling(device_registry, coordinator)
 
-        for coordinator in lifx_coordinators:
-            # Cast the existing connection to a LIFX Ceiling objects
-            ceiling = LIFXCeiling.cast(coordinator.device)
-            self._ceiling_coordinators[ceiling.mac_addr] = coordinator
+    @callback
+    def _async_add_ceiling(
+        self, device_registry: dr.DeviceRegistry, coordinator: LIFXUpdateCoordinator
+    ) -> None:
+        """Adopt the device of a core LIFX coordinator."""
+        # Cast the existing connection to a LIFX Ceiling objects
+        ceiling = LIFXCeiling.cast(coordinator.device)
+        if (stored_state := self._store.get(ceiling.mac_addr)) is not None:
+            ceiling.restore_state(stored_state)
+        self._ceiling_coordinators[ceiling.mac_addr] = coordinator
+
+        self._ceilings.add(ceiling)
+        self._async_start_adaptive_polling(coordinator)
 
-            self._ceilings.add(ceiling)
+        if device_entry := device_registry.async_get_device(
+            identifiers={(DOMAIN, ceiling.mac_addr)}
+        ):
+            self._async_index_device_entry(device_entry)
 
+        if (listeners := self._core_listeners.get(ceiling.mac_addr)) is not None:
+            # Entities already exist, so move them over to the new device.
+            _LOGGER.debug("Re-adopting LIFX Ceiling %s", ceiling.mac_addr)
+            self._discovery_history.append((time.time(), "readopt", ceiling.mac_addr))
+            for update_callback in list(listeners):
+                listeners[update_callback] = coordinator.async_add_listener(
+                    update_callback
+                )
+            async_dispatcher_send(
+                self.hass, SIGNAL_DEVICE_CHANGED.format(ceiling.mac_addr), ceiling
+            )
+        else:
+            self._discovery_history.append((time.time(), "adopt", ceiling.mac_addr))
             if self._discovery_callback and callable(self._discovery_callback):
                 self._discovery_callback(ceiling)
 
-    async def async_set_state(self, call: ServiceCall) -> None:
-        """Handle the set_state service call."""
-        device_ids = call.data.get(ATTR_DEVICE_ID)
-        if not isinstance(device_ids, list):
-            device_ids = [device_ids]
+    @callback
+    def _async_remove_ceiling(self, mac_addr: str) -> None:
+        """Drop a device whose core LIFX coordinator has gone away."""
+        _LOGGER.debug("Dropping LIFX Ceiling %s", mac_addr)
+        self._discovery_history.append((time.time(), "drop", mac_addr))
+        coordinator = self._ceiling_coordinators.pop(mac_addr)
+        self._ceilings.discard(coordinator.device)
+        self._async_stop_adaptive_polling(mac_addr, coordinator)
+        self._async_stop_effect(mac_addr)
+        if isinstance(coordinator.device, LIFXCeiling):
+            coordinator.device.stop_fade()
+        if (cancel_state_check := self._state_checks.pop(mac_addr, None)) is not None:
+            cancel_state_check()
+        self._async_cancel_pending_command(mac_addr)
 
-        transition = call.data.get(ATTR_TRANSITION, 0)
+        for device_id, device in list(self._device_index.items()):
+            if device is coordinator.device:
+                del self._device_index[device_id]
 
-        for device_id in device_ids:
-            device_registry = dr.async_get(self.hass)
-            device_entry = device_registry.async_get(device_id)
+        listeners = self._core_listeners.get(mac_addr, {})
+        for update_callback, remove_listener in list(listeners.items()):
+            if remove_listener is not None:
+                remove_listener()
+            listeners[update_callback] = None
 
-            device: LIFXCeiling | None = None
-            for identifier in device_entry.identifiers:
-                if (
-                    identifier[0] == DOMAIN
-                    and identifier[1] in self._ceiling_coordinators
-                ):
-                    device = self._ceiling_coordinators.get(identifier[1]).device
-
-            if device is not None and isinstance(device, LIFXCeiling):
-                downlight_hue = (
-                    call.data[ATTR_DOWNLIGHT_HUE] / 360 * 65535
-                    if ATTR_DOWNLIGHT_HUE in call.data
-                    else 0
-                )
-                downlight_saturation = (
-                    call.data[ATTR_DOWNLIGHT_SATURATION] / 100 * 65535
-                    if ATTR_DOWNLIGHT_SATURATION in call.data
-                    else 0
-                )
-                downlight_brightness = (
-                    call.data[ATTR_DOWNLIGHT_BRIGHTNESS] / 100 * 65535
-                    if ATTR_DOWNLIGHT_BRIGHTNESS in call.data
-                    else (
-                        device.configured_downlight_brightness
-                        if hasattr(device, "configured_downlight_brightness")
-                        else 65535
-                    )
-                )
-                downlight_kelvin = call.data.get(ATTR_DOWNLIGHT_KELVIN, 3500)
-                downlight_color = (
-                    downlight_hue,
-                    downlight_saturation,
-                    downlight_brightness,
-                    downlight_kelvin,
-                )
+        async_dispatcher_send(self.hass, SIGNAL_DEVICE_CHANGED.format(mac_addr), None)
 
-                uplight_hue = (
-                    call.data[ATTR_UPLIGHT_HUE] / 360 * 65535
-                    if ATTR_UPLIGHT_HUE in call.data
-                    else 0
-                )
-                uplight_saturation = (
-                    call.data[ATTR_UPLIGHT_SATURATION] / 100 * 65535
-                    if ATTR_UPLIGHT_SATURATION in call.data
-                    else 0
-                )
-                uplight_brightness = (
-                    call.data[ATTR_UPLIGHT_BRIGHTNESS] / 100 * 65535
-                    if ATTR_UPLIGHT_BRIGHTNESS in call.data
-                    else (
-                        device.configured_uplight_brightness
-                        if hasattr(device, "configured_uplight_brightness")
-                        else 65535
-                    )
-                )
-                uplight_kelvin = call.data.get(ATTR_UPLIGHT_KELVIN, 3500)
-                uplight_color = (
-                    uplight_hue,
-                    uplight_saturation,
-                    uplight_brightness,
-                    uplight_kelvin,
+    async def _async_for_each_device(
+        self,
+        call: ServiceCall,
+        action: Callable[[LIFXCeiling], Awaitable[None]],
+    ) -> ServiceResponse:
+        """Run a service action for every targeted device at the same time."""
+        device_ids = self._async_target_device_ids(call)
+
+        semaphore = asyncio.Semaphore(SERVICE_MAX_PARALLEL)
+
+        async def _async_run_action(device_id: str) -> None:
+            if (device := self._device_index.get(device_id)) is None:
+                msg = f"Device {device_id} is not a LIFX Ceiling"
+                raise LIFXCeilingError(msg)
+            async with semaphore:
+                await action(device)
+
+        results = await asyncio.gather(
+            *(_async_run_action(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        return self._service_response(call, dict(zip(device_ids, results, strict=True)))
+
+    def _service_response(
+        self,
+        call: ServiceCall,
+        results: dict[str, BaseException | None],
+        **extra: Any,
+    ) -> ServiceResponse:
+        """Return the per device results of a service call, or raise on failure."""
+        device_ids = list(results)
+        errors: dict[str, str] = {}
+        for device_id, result in results.items():
+            if isinstance(result, BaseException):
+                errors[device_id] = str(result) or type(result).__name__
+                _LOGGER.warning(
+                    "Unable to run %s for %s: %s",
+                    call.service,
+                    device_id,
+                    errors[device_id],
                 )
 
-                device.configured_downlight_brightness = downlight_brightness
-                device.configured_uplight_brightness = uplight_brightness
+        if call.return_response:
+            return {
+                "devices": {
+                    device_id: {
+                        "success": device_id not in errors,
+                        "error": errors.get(device_id),
+                    }
+                    for device_id in device_ids
+                },
+                **extra,
+            }
 
-                if not device.downlight_is_on:
-                    downlight_brightness = 0
+        if errors:
+            msg = (
+                f"Unable to run {call.service} for {len(errors)} "
+                f"of {len(device_ids)} devices"
+            )
+            raise HomeAssistantError(msg)
 
-                if not device.uplight_is_on:
-                    uplight_brightness = 0
+        return None
 
-                downlight_color = (
-                    downlight_hue,
-                    downlight_saturation,
-                    downlight_brightness,
-                    downlight_kelvin,
+    async def async_set_state(self, call: ServiceCall) -> ServiceResponse:
+        """
+        Handle the set_state service call.
+
+        Every frame is built before anything is sent, then all requests are
+        handed to aiolifx in one pass without yielding to the event loop, so
+        their packets go out together on the next pass and every ceiling starts
+        its transition together. Acknowledgements are only awaited once the
+        whole burst has been sent.
+        """
+        transition = call.data.get(ATTR_TRANSITION, 0)
+        device_ids = self._async_target_device_ids(call)
+
+        results: dict[str, BaseException | None] = {}
+        frames: dict[str, tuple[LIFXCeiling, HSBKFrame | None]] = {}
+        for device_id in device_ids:
+            if (device := self._device_index.get(device_id)) is None:
+                results[device_id] = LIFXCeilingError(
+                    f"Device {device_id} is not a LIFX Ceiling"
                 )
-                uplight_color = (
-                    uplight_hue,
-                    uplight_saturation,
-                    uplight_brightness,
-                    uplight_kelvin,
+            else:
+                frames[device_id] = (device, self._device_state_frame(device, call))
+
+        acks: dict[str, asyncio.Future[Any]] = {}
+        started = time.perf_counter()
+        for device_id, (device, frame) in frames.items():
+            if frame is None:
+                device.stop_fade()
+                # The eager task hands the request to aiolifx now, so the
+                # burst is not interrupted by waiting for it to start.
+                acks[device_id] = self.config_entry.async_create_task(
+                    self.hass,
+                    async_execute_lifx(
+                        partial(
+                            device.set_power, value="off", duration=transition * 1000
+                        )
+                    ),
+                    f"lifx_ceiling set_state {device.mac_addr}",
+                    eager_start=True,
                 )
+            else:
+                acks[device_id] = device.write_frame(transition)
+
+        for device, _ in frames.values():
+            self._async_schedule_state_check(device.mac_addr, transition)
 
-                final_colors = [downlight_color] * 63 + [uplight_color]
+        # Yield once so aiolifx writes the datagrams, then take the spread
+        # from when each device actually sent its first packet.
+        await asyncio.sleep(0)
+        sent_at = sorted(
+            device.last_sent_at
+            for device, _ in frames.values()
+            if device.last_sent_at is not None and device.last_sent_at >= started
+        )
+        spread_ms = round((sent_at[-1] - sent_at[0]) * 1000, 3) if sent_at else 0
+        _LOGGER.debug(
+            "Sent set_state to %d devices with a spread of %s ms",
+            len(sent_at),
+            spread_ms,
+        )
+
+        ack_results = dict(
+            zip(
+                acks,
+                await asyncio.gather(*acks.values(), return_exceptions=True),
+                strict=True,
+            )
+        )
+        for device_id, (device, _) in frames.items():
+            result = ack_results.get(device_id)
+            results[device_id] = result if isinstance(result, BaseException) else None
+            if results[device_id] is None:
+                self._store.async_save_device(device)
+
+        return self._service_response(
+            call,
+            {device_id: results[device_id] for device_id in device_ids},
+            spread_ms=spread_ms,
+        )
 
-                if downlight_brightness == 0 and uplight_brightness == 0:
-                    await async_execute_lifx(
-                        partial(device.set_power, value="off", duration=transition)
+    async def async_set_downlight_pattern(self, call: ServiceCall) -> ServiceResponse:
+        """Handle the set_downlight_pattern service call."""
+        brightness = call.data[ATTR_BRIGHTNESS_PCT]
+        kelvin = call.data[ATTR_KELVIN]
+        pattern_type = call.data[ATTR_PATTERN]
+        # Each matrix size needs its own pattern, so one is built per geometry.
+        patterns: dict[CeilingGeometry, Sequence[tuple[int, int, int, int]]] = {}
+
+        if pattern_type == PATTERN_IMAGE and not self.hass.config.is_allowed_path(
+            path := call.data[ATTR_IMAGE]
+        ):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="image_path_not_allowed",
+                translation_placeholders={"path": path},
+            )
+
+        async def _async_pattern(
+            geometry: CeilingGeometry,
+        ) -> Sequence[tuple[int, int, int, int]]:
+            if geometry in patterns:
+                return patterns[geometry]
+            if pattern_type == PATTERN_IMAGE:
+                try:
+                    pattern = await self.hass.async_add_executor_job(
+                        image_pattern, path, brightness, kelvin, geometry
                     )
+                except OSError as err:
+                    msg = f"Unable to load image {path}: {err}"
+                    raise HomeAssistantError(msg) from err
+            else:
+                start = hsbk_from_rgb(call.data[ATTR_START_COLOR], brightness, kelvin)
+                end = hsbk_from_rgb(call.data[ATTR_END_COLOR], brightness, kelvin)
+                if pattern_type == PATTERN_RADIAL_GRADIENT:
+                    pattern = radial_gradient(start, end, geometry)
                 else:
-                    device.set64(
-                        tile_index=0,
-                        x=0,
-                        y=0,
-                        width=8,
-                        duration=transition,
-                        colors=final_colors,
+                    pattern = linear_gradient(
+                        start, end, call.data[ATTR_ANGLE], geometry
                     )
+            patterns[geometry] = pattern
+            return pattern
+
+        # Build the patterns up front so a broken image fails the whole call.
+        for geometry in {device.geometry for device in self._ceilings}:
+            await _async_pattern(geometry)
+
+        transition = call.data[ATTR_TRANSITION]
+
+        async def _async_set_device_pattern(device: LIFXCeiling) -> None:
+            await self._async_queue_command(
+                device,
+                transition,
+                downlight_on=True,
+                downlight_color=None,
+                downlight_pattern=await _async_pattern(device.geometry),
+            )
+
+        return await self._async_for_each_device(call, _async_set_device_pattern)
+
+    async def async_start_effect(self, call: ServiceCall) -> ServiceResponse:
+        """Handle the start_effect service call."""
+        effect_type = call.data[ATTR_EFFECT]
+        fps = call.data[ATTR_FPS]
+
+        def _create_effect(zone_count: int) -> LIFXCeilingEffect:
+            brightness = call.data[ATTR_BRIGHTNESS_PCT]
+            kelvin = call.data[ATTR_KELVIN]
+            period = call.data[ATTR_PERIOD]
+            colors = [
+                hsbk_from_rgb(rgb, brightness, kelvin) for rgb in call.data[ATTR_COLORS]
+            ]
+            if effect_type == EFFECT_FADE:
+                return FadeEffect(colors, period, zone_count)
+            if effect_type == EFFECT_PULSE:
+                return PulseEffect(colors[0], period, zone_count)
+            if effect_type == EFFECT_FLAME:
+                return FlameEffect(colors[0], period, zone_count)
+            return ThemeEffect(
+                call.data[ATTR_THEME], percent_to_16bit(brightness), period, zone_count
+            )
+
+        async def _async_start_device_effect(device: LIFXCeiling) -> None:
+            # Each device gets its own effect so random effects are not in sync.
+            effect = _create_effect(device.geometry.downlight_zone_count)
+            await self._async_queue_command(
+                device,
+                0,
+                downlight_on=True,
+                downlight_color=None,
+                downlight_pattern=effect.colors(0),
+            )
+            runner = LIFXCeilingEffectRunner(
+                self.hass,
+                self.config_entry,
+                device,
+                effect,
+                fps,
+                on_done=partial(self._async_effect_done, device.mac_addr),
+            )
+            self._effects[device.mac_addr] = runner
+            runner.start()
+
+        return await self._async_for_each_device(call, _async_start_device_effect)
+
+    async def async_stop_effect(self, call: ServiceCall) -> ServiceResponse:
+        """Handle the stop_effect service call."""
+
+        async def _async_stop_device_effect(device: LIFXCeiling) -> None:
+            self._async_stop_effect(device.mac_addr)
+
+        return await self._async_for_each_device(call, _async_stop_device_effect)
+
+    async def async_pause_fade(self, call: ServiceCall) -> ServiceResponse:
+        """Handle the pause_fade service call."""
+
+        async def _async_pause_device_fade(device: LIFXCeiling) -> None:
+            device.pause_fade()
+
+        return await self._async_for_each_device(call, _async_pause_device_fade)
+
+    async def async_resume_fade(self, call: ServiceCall) -> ServiceResponse:
+        """Handle the resume_fade service call."""
+
+        async def _async_resume_device_fade(device: LIFXCeiling) -> None:
+            device.resume_fade()
+
+        return await self._async_for_each_device(call, _async_resume_device_fade)
+
+    @callback
+    def _async_stop_effect(self, mac_addr: str) -> None:
+        """Stop the effect running on a device, if any."""
+        if (runner := self._effects.pop(mac_addr, None)) is not None:
+            runner.stop()
+
+    @callback
+    def _async_effect_done(
+        self, mac_addr: str, runner: LIFXCeilingEffectRunner
+    ) -> None:
+        """Forget an effect that has stopped, unless another has replaced it."""
+        if self._effects.get(mac_addr) is runner:
+            del self._effects[mac_addr]
+
+    def effect_diagnostics(self, mac_addr: str) -> dict[str, Any] | None:
+        """Return the diagnostics of the effect running on a device, if any."""
+        if (runner := self._effects.get(mac_addr)) is None:
+            return None
+        return runner.as_dict()
+
+    @callback
+    def _async_stop_all_effects(self) -> None:
+        """Stop the effects running on every device."""
+        for mac_addr in list(self._effects):
+            self._async_stop_effect(mac_addr)
+
+    @callback
+    def _async_stop_all_fades(self) -> None:
+        """Stop the local fades running on every device."""
+        for device in self._ceilings:
+            device.stop_fade()
+
+    def _device_state_frame(
+        self, device: LIFXCeiling, call: ServiceCall
+    ) -> HSBKFrame | None:
+        """Return the frame for a set_state call, or None to turn the device off."""
+        self._async_stop_effect(device.mac_addr)
+
+        data = call.data
+        downlight_hue = hue_to_16bit(data.get(ATTR_DOWNLIGHT_HUE, 0))
+        downlight_saturation = percent_to_16bit(data.get(ATTR_DOWNLIGHT_SATURATION, 0))
+        downlight_brightness = (
+            percent_to_16bit(data[ATTR_DOWNLIGHT_BRIGHTNESS])
+            if ATTR_DOWNLIGHT_BRIGHTNESS in data
+            else device.configured_downlight_brightness
+        )
+        downlight_kelvin = int(data.get(ATTR_DOWNLIGHT_KELVIN, 3500))
+
+        uplight_hue = hue_to_16bit(data.get(ATTR_UPLIGHT_HUE, 0))
+        uplight_saturation = percent_to_16bit(data.get(ATTR_UPLIGHT_SATURATION, 0))
+        uplight_brightness = (
+            percent_to_16bit(data[ATTR_UPLIGHT_BRIGHTNESS])
+            if ATTR_UPLIGHT_BRIGHTNESS in data
+            else device.configured_uplight_brightness
+        )
+        uplight_kelvin = int(data.get(ATTR_UPLIGHT_KELVIN, 3500))
+
+        device.configured_downlight_brightness = downlight_brightness
+        device.configured_uplight_brightness = uplight_brightness
+
+        if not device.downlight_is_on:
+            downlight_brightness = 0
+
+        if not device.uplight_is_on:
+            uplight_brightness = 0
+
+        frame = device.section_frame(
+            (
+                downlight_hue,
+                downlight_saturation,
+                downlight_brightness,
+                downlight_kelvin,
+            ),
+            (uplight_hue, uplight_saturation, uplight_brightness, uplight_kelvin),
+        )
+
+        if downlight_brightness == 0 and uplight_brightness == 0:
+            return None
+        return frame
+
+    async def _async_queue_command(
+        self,
+        device: LIFXCeiling,
+        duration: int,
+        **changes: Any,
+    ) -> None:
+        """
+        Merge a section change into the device's pending command and wait.
+
+        Zone group changes are merged with those of other zone groups, so every
+        entity of a device is written with the same frame.
+        """
+        started = time.perf_counter()
+        if "downlight_on" in changes or "zone_groups" in changes:
+            # A new downlight state replaces whatever effect was running.
+            self._async_stop_effect(device.mac_addr)
+
+        pending = self._pending_commands.get(device.mac_addr)
+        if pending is None:
+            pending = _PendingCommand(done=self.hass.loop.create_future())
+            self._pending_commands[device.mac_addr] = pending
+            pending.cancel_flush = async_call_later(
+                self.hass,
+                COMMAND_BATCH_WINDOW,
+                partial(self._async_flush_commands, device),
+            )
+
+        pending.zone_groups.update(changes.pop("zone_groups", {}))
+        for key, value in changes.items():
+            setattr(pending, key, value)
+        pending.duration = max(pending.duration, duration)
+
+        try:
+            await asyncio.shield(pending.done)
+        finally:
+            device.metrics.command_latency.record(time.perf_counter() - started)
+
+    async def _async_flush_commands(
+        self, device: LIFXCeiling, _now: datetime | None = None
+    ) -> None:
+        """
+        Write all pending section changes with one frame.
+
+        The written state is shown straight away and confirmed by a single poll
+        once the transition has finished, rather than polling after every command.
+        """
+        pending = self._pending_commands.pop(device.mac_addr, None)
+        if pending is None:
+            return
+        pending.cancel_flush = None
+
+        core_coordinator = self._ceiling_coordinators.get(device.mac_addr)
+        if core_coordinator is None or core_coordinator.device is not device:
+            msg = f"LIFX Ceiling {device.mac_addr} is not available"
+            pending.done.set_exception(LIFXCeilingError(msg))
+            return
+
+        sections = tuple(
+            section
+            for section, section_on in (
+                ("downlight", pending.downlight_on),
+                ("uplight", pending.uplight_on),
+            )
+            if section_on is not None
+        ) + tuple(pending.zone_groups)
+        started = time.perf_counter()
+        try:
+            await device.async_apply_sections(
+                downlight_on=pending.downlight_on,
+                downlight_color=pending.downlight_color,
+                downlight_pattern=pending.downlight_pattern,
+                uplight_on=pending.uplight_on,
+                uplight_color=pending.uplight_color,
+                zone_groups=pending.zone_groups,
+                duration=pending.duration,
+            )
+        except Exception as err:  # noqa: BLE001
+            device.metrics.record_command(
+                sections, pending.duration, time.perf_counter() - started, repr(err)
+            )
+            pending.done.set_exception(err)
+        else:
+            device.metrics.record_command(
+                sections, pending.duration, time.perf_counter() - started, None
+            )
+            pending.done.set_result(None)
+            core_coordinator.async_update_listeners()
+            self._store.async_save_device(device)
+
+        self._async_schedule_state_check(device.mac_addr, pending.duration)
+
+    def _poll_interval_range(
+        self, coordinator: LIFXUpdateCoordinator
+    ) -> tuple[timedelta, timedelta]:
+        """
+        Return the fastest and slowest poll intervals of a core coordinator.
+
+        The fastest interval is never shorter than the core LIFX integration's
+        own interval, so adaptive polling only ever polls less often.
+        """
+        options = self.config_entry.options
+        fastest = timedelta(
+            seconds=options.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)
+        )
+        slowest = timedelta(
+            seconds=options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+        )
+        if (poll := self._adaptive_polls.get(coordinator.device.mac_addr)) is not None:
+            fastest = max(fastest, poll.original_interval or fastest)
+        return fastest, max(fastest, slowest)
+
+    @callback
+    def _async_start_adaptive_polling(self, coordinator: LIFXUpdateCoordinator) -> None:
+        """Take over the poll interval of a core LIFX coordinator."""
+        mac_addr = coordinator.device.mac_addr
+        self._adaptive_polls[mac_addr] = _AdaptivePoll(
+            original_interval=coordinator.update_interval,
+            remove_listener=coordinator.async_add_listener(
+                partial(self._async_core_updated, mac_addr)
+            ),
+        )
+        coordinator.update_interval = self._poll_interval_range(coordinator)[0]
+
+    @callback
+    def _async_stop_adaptive_polling(
+        self, mac_addr: str, coordinator: LIFXUpdateCoordinator
+    ) -> None:
+        """Give a core LIFX coordinator back its original poll interval."""
+        if (poll := self._adaptive_polls.pop(mac_addr, None)) is not None:
+            poll.remove_listener()
+            coordinator.update_interval = poll.original_interval
+
+    @callback
+    def _async_stop_all_adaptive_polling(self) -> None:
+        """Give every core LIFX coordinator back its original poll interval."""
+        for mac_addr, coordinator in self._ceiling_coordinators.items():
+            self._async_stop_adaptive_polling(mac_addr, coordinator)
+
+    @callback
+    def _async_core_updated(self, mac_addr: str) -> None:
+        """
+        Poll a device quickly after it changes and back off while it stays idle.
+
+        The core coordinator also updates its listeners after every command,
+        so only updates that follow new zone colors read from the device count
+        as a poll. Every poll without a change doubles the interval up to the
+        configured maximum. Zone changes are ignored while an effect or a
+        local fade is running, as they are expected.
+        """
+        poll = self._adaptive_polls.get(mac_addr)
+        coordinator = self._ceiling_coordinators.get(mac_addr)
+        if poll is None or coordinator is None:
+            return
+
+        device = coordinator.device
+        if not isinstance(device, LIFXCeiling) or device.zone_reads == poll.zone_reads:
+            return
+        poll.zone_reads = device.zone_reads
+
+        zones = device.chain.get(0, [])
+        changed = device.power_level != poll.power_level or (
+            mac_addr not in self._effects
+            and not device.fade_active
+            and zones != poll.zones
+        )
+        if changed:
+            poll.power_level = device.power_level
+            poll.zones = list(zones)
+
+        fastest, slowest = self._poll_interval_range(coordinator)
+        if changed or coordinator.update_interval is None:
+            coordinator.update_interval = fastest
+        else:
+            coordinator.update_interval = max(
+                fastest, min(coordinator.update_interval * 2, slowest)
+            )
+
+    @callback
+    def _async_schedule_state_check(self, mac_addr: str, duration: int) -> None:
+        """Poll a device once after its latest command has finished transitioning."""
+        if (cancel_state_check := self._state_checks.pop(mac_addr, None)) is not None:
+            cancel_state_check()
+        if (coordinator := self._ceiling_coordinators.get(mac_addr)) is not None:
+            # Keep polling quickly for a while after the command.
+            coordinator.update_interval = self._poll_interval_range(coordinator)[0]
+        self._state_checks[mac_addr] = async_call_later(
+            self.hass,
+            duration + STATE_CHECK_DELAY,
+            partial(self._async_check_state, mac_addr),
+        )
+
+    async def _async_check_state(
+        self, mac_addr: str, _now: datetime | None = None
+    ) -> None:
+        """Refresh the zones and power of a device, then update its entities once."""
+        self._state_checks.pop(mac_addr, None)
+        core_coordinator = self._ceiling_coordinators.get(mac_addr)
+        if core_coordinator is None or not isinstance(
+            device := core_coordinator.device, LIFXCeiling
+        ):
+            return
+
+        try:
+            await device.async_refresh_zones()
+        except TimeoutError as err:
+            _LOGGER.debug("Unable to refresh %s: %s", mac_addr, err)
+            return
+        except Exception as err:  # noqa: BLE001
+            # The core coordinator keeps polling, so the next poll catches up.
+            _LOGGER.warning("Unable to refresh %s: %r", mac_addr, err)
+            return
+
+        if self._ceiling_coordinators.get(mac_addr) is core_coordinator:
+            core_coordinator.async_update_listeners()
+
+    @callback
+    def _async_cancel_pending_command(self, mac_addr: str) -> None:
+        """Drop the pending command of a device and fail everything waiting on it."""
+        if (pending := self._pending_commands.pop(mac_addr, None)) is None:
+            return
+        if pending.cancel_flush is not None:
+            pending.cancel_flush()
+        if not pending.done.done():
+            msg = f"LIFX Ceiling {mac_addr} is not available"
+            pending.done.set_exception(LIFXCeilingError(msg))
+
+    @callback
+    def _async_cancel_pending_commands(self) -> None:
+        """Drop the pending commands of every device."""
+        for mac_addr in list(self._pending_commands):
+            self._async_cancel_pending_command(mac_addr)
+
+    @callback
+    def _async_cancel_state_checks(self) -> None:
+        """Cancel all scheduled state checks."""
+        for cancel_state_check in self._state_checks.values():
+            cancel_state_check()
+        self._state_checks.clear()
 
     async def turn_uplight_on(
         self, device: LIFXCeiling, color: tuple[int, int, int, int], duration: int = 0
     ) -> None:
         """Turn on the uplight."""
-        await device.turn_uplight_on(color, duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_queue_command(
+            device, duration, uplight_on=True, uplight_color=color
+        )
 
     async def turn_uplight_off(self, device: LIFXCeiling, duration: int = 0) -> None:
         """Turn off the uplight."""
-        await device.turn_uplight_off(duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_queue_command(
+            device, duration, uplight_on=False, uplight_color=None
+        )
 
     async def turn_downlight_on(
         self, device: LIFXCeiling, color: tuple[int, int, int, int], duration: int = 0
     ) -> None:
         """Turn on the downlight."""
-        await device.turn_downlight_on(color, duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_queue_command(
+            device,
+            duration,
+            downlight_on=True,
+            downlight_color=color,
+            downlight_pattern=None,
+        )
 
     async def turn_downlight_off(self, device: LIFXCeiling, duration: int = 0) -> None:
         """Turn off the downlight."""
-        await device.turn_downlight_off(duration)
-        await self._ceiling_coordinators[device.mac_addr].async_request_refresh()
+        await self._async_queue_command(
+            device,
+            duration,
+            downlight_on=False,
+            downlight_color=None,
+            downlight_pattern=None,
+        )
+
+    async def turn_zone_group_on(
+        self,
+        device: LIFXCeiling,
+        group: str,
+        color: tuple[int, int, int, int],
+        duration: int = 0,
+    ) -> None:
+        """Turn on a zone group of the downlight."""
+        await self._async_queue_command(device, duration, zone_groups={group: color})
+
+    async def turn_zone_group_off(
+        self, device: LIFXCeiling, group: str, duration: int = 0
+    ) -> None:
+        """Turn off a zone group of the downlight."""
+        await self._async_queue_command(device, duration, zone_groups={group: None})
+
+
+def _has_target(ids: str | list[str] | None) -> bool:
+    """Return if a target field names anything."""
+    return bool(ids) and ids != ENTITY_MATCH_NONE
@@ -0,0 +1,63 @@
+"""Diagnostics support for LIFX Ceiling."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api import LIFXCeiling
+    from .coordinator import LIFXCeilingConfigEntry, LIFXCeilingUpdateCoordinator
+
+
+def _serial(mac_addr: str) -> str:
+    """Return the serial number of a device from its MAC address."""
+    return mac_addr.replace(":", "").lower()
+
+
+def _device_diagnostics(
+    coordinator: LIFXCeilingUpdateCoordinator, device: LIFXCeiling
+) -> dict[str, Any]:
+    """Return the known state, metrics, effect and fade of a single device."""
+    return {
+        "serial": _serial(device.mac_addr),
+        "model": device.model,
+        "geometry": {
+            "width": device.geometry.width,
+            "height": device.geometry.height,
+            "uplight_zones": list(device.geometry.uplight_zones),
+        },
+        "power_level": device.power_level,
+        "downlight_is_on": device.downlight_is_on,
+        "uplight_is_on": device.uplight_is_on,
+        "configured_downlight_brightness": device.configured_downlight_brightness,
+        "configured_uplight_brightness": device.configured_uplight_brightness,
+        "zone_generation": device.zone_generation,
+        "zones": [list(zone) for zone in device.chain.get(0, [])],
+        "metrics": device.metrics.as_dict(),
+        "effect": coordinator.effect_diagnostics(device.mac_addr),
+        "fade": device.fade_diagnostics,
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: LIFXCeilingConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for the config entry."""
+    coordinator = entry.runtime_data
+    return {
+        "devices": [
+            _device_diagnostics(coordinator, device) for device in coordinator.devices
+        ],
+        "discovery_history": [
+            {
+                "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                "event": event,
+                "serial": _serial(mac_addr) if mac_addr is not None else None,
+            }
+            for timestamp, event, mac_addr in coordinator.discovery_history
+        ],
+    }
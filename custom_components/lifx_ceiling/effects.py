@@ -0,0 +1,245 @@
+"""Local downlight effects for the LIFX Ceiling matrix."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from aiolifx_themes.themes import ThemeLibrary
+
+from .const import _LOGGER
+from .patterns import DOWNLIGHT_ZONE_COUNT, blend
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .api import LIFXCeiling
+    from .patterns import HSBK
+
+
+class LIFXCeilingEffect(ABC):
+    """Base class for an animated downlight effect."""
+
+    def __init__(self, period: float, zone_count: int = DOWNLIGHT_ZONE_COUNT) -> None:
+        """Initialize the effect with its cycle length in seconds and zone count."""
+        self.period = period
+        self.zone_count = zone_count
+
+    @abstractmethod
+    def colors(self, elapsed: float) -> Sequence[HSBK]:
+        """Return the downlight zone colors for the given elapsed time in seconds."""
+
+
+class FadeEffect(LIFXCeilingEffect):
+    """Fade the whole downlight through a list of colors."""
+
+    def __init__(
+        self,
+        colors: Sequence[HSBK],
+        period: float,
+        zone_count: int = DOWNLIGHT_ZONE_COUNT,
+    ) -> None:
+        """Initialize the fade effect."""
+        super().__init__(period, zone_count)
+        self._colors = list(colors)
+
+    def colors(self, elapsed: float) -> Sequence[HSBK]:
+        """Return the same blended color for every downlight zone."""
+        position = (elapsed / self.period) % 1 * len(self._colors)
+        index = int(position)
+        color = blend(
+            self._colors[index],
+            self._colors[(index + 1) % len(self._colors)],
+            position - index,
+        )
+        return [color] * self.zone_count
+
+
+class PulseEffect(LIFXCeilingEffect):
+    """Pulse the brightness of the whole downlight."""
+
+    def __init__(
+        self, color: HSBK, period: float, zone_count: int = DOWNLIGHT_ZONE_COUNT
+    ) -> None:
+        """Initialize the pulse effect."""
+        super().__init__(period, zone_count)
+        self._color = color
+
+    def colors(self, elapsed: float) -> Sequence[HSBK]:
+        """Return the color scaled by a smooth rise and fall of brightness."""
+        hue, saturation, brightness, kelvin = self._color
+        level = 0.5 - 0.5 * math.cos(2 * math.pi * elapsed / self.period)
+        return [(hue, saturation, int(brightness * level), kelvin)] * self.zone_count
+
+
+class FlameEffect(LIFXCeilingEffect):
+    """Flicker each downlight zone independently like a flame."""
+
+    def __init__(
+        self, color: HSBK, period: float, zone_count: int = DOWNLIGHT_ZONE_COUNT
+    ) -> None:
+        """Initialize the flame effect around a base color."""
+        super().__init__(period, zone_count)
+        self._color = color
+        self._random = random.Random()  # noqa: S311
+        self._levels = [1.0] * zone_count
+        self._last_elapsed = 0.0
+
+    def colors(self, elapsed: float) -> Sequence[HSBK]:
+        """Return each zone with a brightness drifting towards a random target."""
+        hue, saturation, brightness, kelvin = self._color
+        # Move further towards the new target the more time has passed, so the
+        # flicker speed does not depend on the frame rate.
+        step = min(1.0, (elapsed - self._last_elapsed) / self.period)
+        self._last_elapsed = elapsed
+        uniform = self._random.uniform
+        self._levels = [
+            level + (uniform(0.3, 1.0) - level) * step for level in self._levels
+        ]
+        return [
+            (
+                (hue + int(uniform(-1, 1) * 1200 * (1 - level))) % 65536,
+                saturation,
+                int(brightness * level),
+                kelvin,
+            )
+            for level in self._levels
+        ]
+
+
+class ThemeEffect(LIFXCeilingEffect):
+    """Slowly rotate the colors of a LIFX app theme across the downlight zones."""
+
+    def __init__(
+        self,
+        theme: str,
+        brightness: int,
+        period: float,
+        zone_count: int = DOWNLIGHT_ZONE_COUNT,
+    ) -> None:
+        """Initialize the theme effect."""
+        super().__init__(period, zone_count)
+        self._colors = [
+            (hue, saturation, brightness, kelvin)
+            for hue, saturation, _, kelvin in ThemeLibrary().get_theme(theme).colors
+        ]
+
+    def colors(self, elapsed: float) -> Sequence[HSBK]:
+        """Return theme colors spread over the zones and shifted over time."""
+        count = len(self._colors)
+        offset = (elapsed / self.period) % 1 * count
+        zone_colors = []
+        for zone in range(self.zone_count):
+            position = (zone / self.zone_count * count + offset) % count
+            index = int(position)
+            zone_colors.append(
+                blend(
+                    self._colors[index],
+                    self._colors[(index + 1) % count],
+                    position - index,
+                )
+            )
+        return zone_colors
+
+
+class LIFXCeilingEffectRunner:
+    """Send the frames of an effect to a device at a fixed frame rate."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        device: LIFXCeiling,
+        effect: LIFXCeilingEffect,
+        fps: float,
+        *,
+        on_done: Callable[[LIFXCeilingEffectRunner], None],
+    ) -> None:
+        """
+        Initialize the effect runner, frame 0 is the effect at elapsed time 0.
+
+        on_done is called with the runner once it has stopped for any reason.
+        """
+        self._hass = hass
+        self._config_entry = config_entry
+        self._device = device
+        self._effect = effect
+        self._fps = fps
+        self._interval = 1 / fps
+        self._on_done = on_done
+        self._task: asyncio.Task[None] | None = None
+        self.frames_sent = 0
+        self.frames_skipped = 0
+
+    @property
+    def running(self) -> bool:
+        """Return if the effect is running."""
+        return self._task is not None and not self._task.done()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the frame rate and frame counts for diagnostics."""
+        return {
+            "effect": type(self._effect).__name__,
+            "fps": self._fps,
+            "running": self.running,
+            "frames_sent": self.frames_sent,
+            "frames_skipped": self.frames_skipped,
+        }
+
+    def start(self) -> None:
+        """Start sending frames after the first frame has been written."""
+        self._task = self._config_entry.async_create_background_task(
+            self._hass,
+            self._async_run(),
+            f"lifx_ceiling effect {self._device.mac_addr}",
+        )
+        self._task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        """Log why the effect stopped, unless it was stopped on purpose."""
+        if not task.cancelled() and (err := task.exception()) is not None:
+            _LOGGER.error(
+                "Effect on %s stopped: %r", self._device.mac_addr, err, exc_info=err
+            )
+        self._on_done(self)
+
+    def stop(self) -> None:
+        """Stop sending frames, leaving the last frame on the device."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_run(self) -> None:
+        """
+        Send a frame every interval.
+
+        Frame times are derived from the start time rather than the previous
+        frame so timing does not drift. Frames that are already a whole interval
+        late when the loop gets to them are skipped rather than sent in a burst.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        frame_number = 1
+
+        while True:
+            delay = start + frame_number * self._interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif (late := int(-delay / self._interval)) > 0:
+                frame_number += late
+                self.frames_skipped += late
+                _LOGGER.debug(
+                    "Skipped %d effect frames for %s", late, self._device.mac_addr
+                )
+
+            self._device.set_downlight_zones(
+                self._effect.colors(frame_number * self._interval)
+            )
+            self.frames_sent += 1
+            frame_number += 1
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_DEVICE_CHANGED
 from .coordinator import LIFXCeilingUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -25,6 +27,8 @@ class LIFXCeilingEntity(CoordinatorEntity[LIFXCeilingUpdateCoordinator]):
     ) -> None:
         """Initialise the light."""
         super().__init__(coordinator)
+        self._device = device
+        self._device_available = True
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device.mac_addr)},
             connections={(dr.CONNECTION_NETWORK_MAC, device.mac_addr)},
@@ -35,3 +39,35 @@ class LIFXCeilingEntity(CoordinatorEntity[LIFXCeilingUpdateCoordinator]):
             sw_version=device.host_firmware_version,
             suggested_area=device.group,
         )
+
+    @property
+    def available(self) -> bool:
+        """Return if the device is currently adopted from the core integration."""
+        return self._device_available and super().available
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the device if it is dropped or re-adopted by the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_CHANGED.format(self._device.mac_addr),
+                self._async_device_changed,
+            )
+        )
+
+    @callback
+    def _async_device_changed(self, device: LIFXCeiling | None) -> None:
+        """Handle the device being dropped or replaced by a new device object."""
+        self._device_available = device is not None
+        if device is None:
+            self.async_write_ha_state()
+            return
+
+        self._device = device
+        self._update_callback()
+
+    @callback
+    def _update_callback(self) -> None:
+        """Handle updates from the core LIFX coordinator."""
+        self.async_write_ha_state()
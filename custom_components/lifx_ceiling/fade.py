@@ -0,0 +1,234 @@
+"""Local interpolation of long transitions for the LIFX Ceiling."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    FADE_KEYFRAME_STEP,
+    FADE_MAX_KEYFRAME_INTERVAL,
+    FADE_MIN_KEYFRAME_INTERVAL,
+)
+from .convert import (
+    MAX_KELVIN,
+    MIN_KELVIN,
+    brightness_to_lightness,
+    hue_to_16bit,
+    hue_to_degrees,
+    kelvin_to_mired,
+    lightness_to_brightness,
+    mired_to_kelvin,
+)
+from .frame import HSBKFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    type HSBK = tuple[int, int, int, int]
+    type Perceptual = tuple[float, float, float, float]
+
+# Mired distance between the coolest and warmest color temperature.
+MIRED_SPAN = kelvin_to_mired(MIN_KELVIN) - kelvin_to_mired(MAX_KELVIN)
+
+
+def _to_perceptual(color: HSBK) -> Perceptual:
+    """Return lightness, hue in degrees, saturation (0-100) and mired of a color."""
+    hue, saturation, brightness, kelvin = color
+    return (
+        brightness_to_lightness(brightness),
+        hue_to_degrees(hue),
+        saturation / 655.35,
+        kelvin_to_mired(kelvin),
+    )
+
+
+def _from_perceptual(color: Perceptual) -> HSBK:
+    """Return the HSBK color for lightness, hue, saturation and mired values."""
+    lightness, hue, saturation, mired = color
+    return (
+        hue_to_16bit(hue),
+        min(65535, max(0, round(saturation * 655.35))),
+        lightness_to_brightness(lightness),
+        mired_to_kelvin(mired),
+    )
+
+
+class LIFXCeilingFade:
+    """
+    Fade every zone of a device from one frame to another.
+
+    Colors are interpolated in a perceptual space, with brightness as CIE
+    lightness, kelvin as mired and hue along the shortest way around the color
+    wheel. Each keyframe is written as a device transition that lasts until the
+    next one, so keyframes can be sparse when the change is slow. Work is only
+    done when a keyframe is due, however long the fade.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[HSBKFrame, float], asyncio.Future[None]],
+        start: Sequence[HSBK],
+        target: Sequence[HSBK],
+        duration: float,
+    ) -> None:
+        """Initialize a fade that writes each keyframe with a transition time."""
+        self._write = write
+        self._loop = asyncio.get_running_loop()
+        self.target = HSBKFrame(len(target)).load(target)
+        self._keyframe = HSBKFrame(len(target))
+        self._handle: asyncio.TimerHandle | None = None
+        self._started_at = 0.0
+        self._paused = False
+        self._cancelled = False
+        self.keyframes_sent = 0
+        self._set_path(start, duration)
+
+    def _set_path(self, start: Sequence[HSBK], duration: float) -> None:
+        """Plan the keyframes from start to the target over duration seconds."""
+        self._start = [_to_perceptual(color) for color in start]
+        self._delta = []
+        distance = 0.0
+        for begin, end in zip(
+            self._start,
+            (_to_perceptual(color) for color in self.target.colors()),
+            strict=True,
+        ):
+            delta = (
+                end[0] - begin[0],
+                (end[1] - begin[1] + 180) % 360 - 180,
+                end[2] - begin[2],
+                end[3] - begin[3],
+            )
+            self._delta.append(delta)
+            distance = max(
+                distance,
+                abs(delta[0]),
+                abs(delta[1]) / 3.6,
+                abs(delta[2]),
+                abs(delta[3]) / MIRED_SPAN * 100,
+            )
+
+        self._duration = duration
+        interval = min(
+            max(
+                duration / max(1, math.ceil(distance / FADE_KEYFRAME_STEP)),
+                FADE_MIN_KEYFRAME_INTERVAL,
+            ),
+            FADE_MAX_KEYFRAME_INTERVAL,
+        )
+        self._keyframe_count = max(1, math.ceil(duration / interval))
+        self._interval = duration / self._keyframe_count
+
+    def _colors_at(self, progress: float) -> list[HSBK]:
+        """Return the color of every zone the given fraction of the way through."""
+        return [
+            _from_perceptual(
+                (
+                    begin[0] + delta[0] * progress,
+                    (begin[1] + delta[1] * progress) % 360,
+                    begin[2] + delta[2] * progress,
+                    begin[3] + delta[3] * progress,
+                )
+            )
+            for begin, delta in zip(self._start, self._delta, strict=True)
+        ]
+
+    def _progress(self) -> float:
+        """Return how far through the fade the current time is, from 0 to 1."""
+        if self._paused or self._duration <= 0:
+            return 0.0 if self._paused else 1.0
+        return min(1.0, (self._loop.time() - self._started_at) / self._duration)
+
+    @property
+    def active(self) -> bool:
+        """Return if the fade is still running or is paused."""
+        return not self._cancelled and (self._paused or self._progress() < 1)
+
+    @property
+    def paused(self) -> bool:
+        """Return if the fade is paused."""
+        return self._paused
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress and keyframe counts for diagnostics."""
+        return {
+            "active": self.active,
+            "paused": self._paused,
+            "keyframes_sent": self.keyframes_sent,
+            "keyframe_count": self._keyframe_count,
+        }
+
+    def current_colors(self) -> list[HSBK]:
+        """Return the color every zone has reached at the current time."""
+        return self._colors_at(self._progress())
+
+    def start(self) -> asyncio.Future[None]:
+        """Start the fade and return the write of the first keyframe."""
+        self._paused = False
+        self._started_at = self._loop.time()
+        return self._send_keyframe(1)
+
+    def _send_keyframe(self, number: int) -> asyncio.Future[None]:
+        """Write a keyframe as a transition, then schedule the next one."""
+        self._handle = None
+        self._keyframe.load(self._colors_at(number / self._keyframe_count))
+        future = self._write(self._keyframe, self._interval)
+        self.keyframes_sent += 1
+        if number < self._keyframe_count:
+            self._handle = self._loop.call_at(
+                self._started_at + number * self._interval,
+                self._send_keyframe,
+                number + 1,
+            )
+        return future
+
+    def pause(self) -> None:
+        """Hold every zone at its current color until the fade is resumed."""
+        if not self.active or self._paused:
+            return
+        progress = self._progress()
+        self._cancel_handle()
+        current = self._colors_at(progress)
+        self._set_path(current, self._duration * (1 - progress))
+        self._paused = True
+        self._write(self._keyframe.load(current), 0)
+
+    def resume(self) -> asyncio.Future[None] | None:
+        """Continue a paused fade over the time it had left."""
+        if not self._paused or self._cancelled:
+            return None
+        return self.start()
+
+    def retarget(self, target: Sequence[HSBK], duration: float) -> asyncio.Future[None]:
+        """Fade from the current colors to a new target over duration seconds."""
+        current = self.current_colors()
+        self._cancel_handle()
+        self.target.load(target)
+        self._set_path(current, duration)
+        return self.start()
+
+    def hold_zones(self, zones: Iterable[int], target: Sequence[HSBK]) -> bool:
+        """
+        Move zones straight to their color in a new target and hold them there.
+
+        The other zones keep fading along their path. Returns if any zone is
+        still fading.
+        """
+        self.target.load(target)
+        for zone in zones:
+            self._start[zone] = _to_perceptual(target[zone])
+            self._delta[zone] = (0.0, 0.0, 0.0, 0.0)
+        return any(any(delta) for delta in self._delta)
+
+    def cancel(self) -> None:
+        """Stop sending keyframes, leaving the device on its last transition."""
+        self._cancelled = True
+        self._cancel_handle()
+
+    def _cancel_handle(self) -> None:
+        """Cancel the next scheduled keyframe."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
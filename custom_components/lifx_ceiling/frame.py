@@ -0,0 +1,109 @@
+"""Compact HSBK frame buffer for LIFX Ceiling zone writes."""
+
+from __future__ import annotations
+
+from array import array
+from itertools import chain
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class HSBKFrame:
+    """
+    A frame of HSBK zone colors backed by a flat array of unsigned shorts.
+
+    Each zone uses four consecutive values: hue, saturation, brightness and
+    kelvin. All bulk operations are array slice assignments, so building a
+    frame does not allocate a tuple per zone until it is sent.
+    """
+
+    __slots__ = ("_buffer", "zone_count")
+
+    def __init__(self, zone_count: int) -> None:
+        """Initialize a frame with all zones set to zero."""
+        self.zone_count = zone_count
+        self._buffer = array("H", bytes(zone_count * 8))
+
+    def load(self, zones: Iterable[tuple[int, int, int, int]]) -> HSBKFrame:
+        """Replace the frame with the given zone colors."""
+        self._buffer[:] = array("H", chain.from_iterable(zones))
+        return self
+
+    def load_frame(self, other: HSBKFrame) -> HSBKFrame:
+        """Replace the frame with a copy of another frame of the same size."""
+        self._buffer[:] = other._buffer
+        return self
+
+    def fill(
+        self, color: tuple[int, int, int, int], start: int = 0, stop: int | None = None
+    ) -> HSBKFrame:
+        """Set zones from start up to stop to the same color."""
+        stop = self.zone_count if stop is None else stop
+        self._buffer[start * 4 : stop * 4] = _hsbk_array(color) * (stop - start)
+        return self
+
+    def set_zones(
+        self, start: int, colors: Iterable[tuple[int, int, int, int]]
+    ) -> HSBKFrame:
+        """Set consecutive zones from start to each of the given colors."""
+        values = array("H", chain.from_iterable(colors))
+        self._buffer[start * 4 : start * 4 + len(values)] = values
+        return self
+
+    def zero_brightness(self, start: int = 0, stop: int | None = None) -> HSBKFrame:
+        """Set the brightness of zones from start up to stop to zero."""
+        stop = self.zone_count if stop is None else stop
+        self._buffer[start * 4 + 2 : stop * 4 : 4] = array(
+            "H", bytes(2 * (stop - start))
+        )
+        return self
+
+    def max_brightness(self, start: int = 0, stop: int | None = None) -> int:
+        """Return the highest brightness of zones from start up to stop."""
+        stop = self.zone_count if stop is None else stop
+        return max(self._buffer[start * 4 + 2 : stop * 4 : 4], default=0)
+
+    def changed_zones(self, other: HSBKFrame) -> list[int]:
+        """Return the index of every zone with a different color in another frame."""
+        ours, theirs = self._buffer, other._buffer
+        if ours == theirs:
+            return []
+        return [
+            index
+            for index in range(self.zone_count)
+            if ours[index * 4 : index * 4 + 4] != theirs[index * 4 : index * 4 + 4]
+        ]
+
+    def rectangle(
+        self, x: int, y: int, width: int, matrix_width: int
+    ) -> list[tuple[int, int, int, int]]:
+        """
+        Return the colors of a set64 rectangle.
+
+        The rectangle covers as many rows from y as fit in 64 colors, stopping at
+        the last row of the matrix.
+        """
+        last_row = min(self.zone_count // matrix_width, y + 64 // width)
+        zones = []
+        for row in range(y, last_row):
+            start = row * matrix_width + x
+            zones.extend(self.colors(start, start + width))
+        return zones
+
+    def colors(
+        self, start: int = 0, stop: int | None = None
+    ) -> list[tuple[int, int, int, int]]:
+        """Return zone colors from start up to stop as a list for set64."""
+        stop = self.zone_count if stop is None else stop
+        zones = self._buffer[start * 4 : stop * 4]
+        return list(
+            zip(zones[0::4], zones[1::4], zones[2::4], zones[3::4], strict=True)
+        )
+
+
+def _hsbk_array(color: tuple[float, float, float, float]) -> array[int]:
+    """Return a color as an array, converting any float values to int."""
+    hue, saturation, brightness, kelvin = color
+    return array("H", (int(hue), int(saturation), int(brightness), int(kelvin)))
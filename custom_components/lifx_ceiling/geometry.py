@@ -0,0 +1,146 @@
+"""Zone layout of each LIFX Ceiling product."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .const import (
+    ZONE_GROUP_BOTTOM_LEFT,
+    ZONE_GROUP_BOTTOM_RIGHT,
+    ZONE_GROUP_INNER_RING,
+    ZONE_GROUP_OUTER_RING,
+    ZONE_GROUP_TOP_LEFT,
+    ZONE_GROUP_TOP_RIGHT,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Number of colors carried by every Set64 and State64 message.
+SET64_ZONE_COUNT = 64
+
+
+@dataclass(frozen=True, slots=True)
+class CeilingGeometry:
+    """
+    The matrix size of a Ceiling and which of its zones form the uplight.
+
+    Every Ceiling is a single tile, so zones are numbered from 0 row by row
+    across the whole matrix. Every zone that is not part of the uplight ring
+    belongs to the downlight.
+    """
+
+    width: int
+    height: int
+    uplight_zones: tuple[int, ...]
+    downlight_zones: tuple[int, ...] = field(init=False)
+    downlight_ranges: tuple[tuple[int, int], ...] = field(init=False)
+    uplight_ranges: tuple[tuple[int, int], ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Work out the downlight zones and the runs of consecutive zones."""
+        uplight = set(self.uplight_zones)
+        downlight = tuple(
+            zone for zone in range(self.width * self.height) if zone not in uplight
+        )
+        # The dataclass is frozen, so derived fields are set through object.
+        object.__setattr__(self, "downlight_zones", downlight)
+        object.__setattr__(self, "downlight_ranges", _ranges(downlight))
+        object.__setattr__(self, "uplight_ranges", _ranges(self.uplight_zones))
+
+    @property
+    def zone_count(self) -> int:
+        """Return the number of zones on the tile."""
+        return self.width * self.height
+
+    @property
+    def downlight_zone_count(self) -> int:
+        """Return the number of downlight zones."""
+        return len(self.downlight_zones)
+
+    @property
+    def rows_per_set64(self) -> int:
+        """Return how many full rows a single Set64 or Get64 message covers."""
+        return SET64_ZONE_COUNT // self.width
+
+    def set64_rectangles(self, zones: Iterable[int]) -> list[tuple[int, int, int]]:
+        """
+        Return the x, y and width of the fewest set64 writes covering the zones.
+
+        The writes span the changed columns from the first changed row to the
+        last. Each one carries 64 colors, so one is enough for a tile of up to
+        64 zones and larger tiles need a write per block of rows. Returns an
+        empty list when there are no zones to write.
+        """
+        columns = []
+        rows = []
+        for zone in zones:
+            rows.append(zone // self.width)
+            columns.append(zone % self.width)
+        if not rows:
+            return []
+        x = min(columns)
+        width = max(columns) - x + 1
+        step = SET64_ZONE_COUNT // width
+        return [(x, y, width) for y in range(min(rows), max(rows) + 1, step)]
+
+
+def _ranges(zones: Iterable[int]) -> tuple[tuple[int, int], ...]:
+    """Return the start and stop of each run of consecutive zones."""
+    ranges: list[tuple[int, int]] = []
+    for zone in sorted(zones):
+        if ranges and ranges[-1][1] == zone:
+            ranges[-1] = (ranges[-1][0], zone + 1)
+        else:
+            ranges.append((zone, zone + 1))
+    return tuple(ranges)
+
+
+# The original 8x8 Ceiling, where the last zone is the uplight.
+DEFAULT_GEOMETRY = CeilingGeometry(width=8, height=8, uplight_zones=(63,))
+
+# Matrix size and uplight zones by LIFX product ID.
+CEILING_GEOMETRIES: dict[int, CeilingGeometry] = {
+    176: DEFAULT_GEOMETRY,
+    177: DEFAULT_GEOMETRY,
+    # The 13x26" Ceiling has a 16x8 matrix that also ends with the uplight.
+    201: CeilingGeometry(width=16, height=8, uplight_zones=(127,)),
+    202: CeilingGeometry(width=16, height=8, uplight_zones=(127,)),
+}
+
+
+def geometry_for_product(product: int) -> CeilingGeometry:
+    """Return the geometry of a product, or the 8x8 layout when it is unknown."""
+    return CEILING_GEOMETRIES.get(product, DEFAULT_GEOMETRY)
+
+
+@lru_cache(maxsize=32)
+def zone_group_ranges(
+    geometry: CeilingGeometry, group: str
+) -> tuple[tuple[int, int], ...]:
+    """
+    Return the start and stop of each run of downlight zones in a zone group.
+
+    The inner ring is the middle half of the matrix in both directions and the
+    outer ring is every other downlight zone. Each quadrant is a quarter of the
+    matrix, such as the top left.
+    """
+    center_x = (geometry.width - 1) / 2
+    center_y = (geometry.height - 1) / 2
+    zones = []
+    for zone in geometry.downlight_zones:
+        x = zone % geometry.width - center_x
+        y = zone // geometry.width - center_y
+        inner = abs(x) < geometry.width / 4 and abs(y) < geometry.height / 4
+        if {
+            ZONE_GROUP_INNER_RING: inner,
+            ZONE_GROUP_OUTER_RING: not inner,
+            ZONE_GROUP_TOP_LEFT: x < 0 and y < 0,
+            ZONE_GROUP_TOP_RIGHT: x > 0 and y < 0,
+            ZONE_GROUP_BOTTOM_LEFT: x < 0 and y > 0,
+            ZONE_GROUP_BOTTOM_RIGHT: x > 0 and y > 0,
+        }[group]:
+            zones.append(zone)
+    return _ranges(zones)
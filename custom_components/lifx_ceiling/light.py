@@ -10,9 +10,13 @@ from homeassistant.components.light import (
     LightEntity,
     LightEntityFeature,
 )
+from homeassistant.const import Platform
 from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import format_mac
 
+from .const import CONF_ZONE_GROUPS, ZONE_GROUPS
+from .convert import brightness_to_8bit, hs_from_16bit
 from .entity import LIFXCeilingEntity
 from .util import hsbk_for_turn_on
 
@@ -26,7 +30,7 @@ if TYPE_CHECKING:
         LIFXCeilingUpdateCoordinator,
     )
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -36,54 +40,122 @@ async def async_setup_entry(
 ) -> None:
     """Set up LIFX Ceiling extra lights."""
     coordinator: LIFXCeilingUpdateCoordinator = entry.runtime_data
+    zone_groups: list[str] = entry.options.get(CONF_ZONE_GROUPS, [])
+
+    # Remove the lights of zone groups that are no longer configured.
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        group = entity_entry.unique_id.partition("_")[2]
+        if (
+            entity_entry.domain == Platform.LIGHT
+            and group in ZONE_GROUPS
+            and group not in zone_groups
+        ):
+            entity_registry.async_remove(entity_entry.entity_id)
 
     @callback
-    def _add_ceiling_entities(device: LIFXCeiling) -> None:
+    def _add_lights(device: LIFXCeiling) -> None:
         async_add_entities(
             [
                 LIFXCeilingDownlight(coordinator, device),
                 LIFXCeilingUplight(coordinator, device),
+                *(
+                    LIFXCeilingZoneGroup(coordinator, device, group)
+                    for group in zone_groups
+                ),
             ]
         )
 
     for device in coordinator.devices:
-        _add_ceiling_entities(device)
+        _add_lights(device)
 
-    coordinator.set_discovery_callback(_add_ceiling_entities)
+    @callback
+    def _add_ceiling_entities(device: LIFXCeiling) -> None:
+        _add_lights(device)
+        if previous_callback is not None:
+            previous_callback(device)
 
+    # Chain to the discovery callback of any platform that was set up first.
+    previous_callback = coordinator.set_discovery_callback(_add_ceiling_entities)
 
-class LIFXCeilingDownlight(LIFXCeilingEntity, LightEntity):
-    """Represents the LIFX Ceiling downlight zone."""
+
+class LIFXCeilingLight(LIFXCeilingEntity, LightEntity):
+    """Base class for a LIFX Ceiling light section."""
 
     _attr_supported_features = LightEntityFeature.TRANSITION
 
     def __init__(
         self, coordinator: LIFXCeilingUpdateCoordinator, device: LIFXCeiling
     ) -> None:
-        """Instantiate the zoned light."""
+        """Instantiate the light section."""
         super().__init__(coordinator, device)
-        self._device = device
-        coordinator.async_add_core_listener(device, self._update_callback)
+        self._last_state: tuple[Any, ...] | None = None
 
         self._attr_supported_color_modes = {ColorMode.COLOR_TEMP, ColorMode.HS}
-        self._attr_name = "Downlight"
-        self._attr_unique_id = f"{format_mac(device.mac_addr)}_downlight"
         self._attr_max_color_temp_kelvin = device.max_kelvin
         self._attr_min_color_temp_kelvin = device.min_kelvin
 
+    async def async_added_to_hass(self) -> None:
+        """Listen for updates from the core LIFX coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_core_listener(
+                self._device, self._update_callback
+            )
+        )
+        self._update_callback()
+
+    @callback
+    def _async_device_changed(self, device: LIFXCeiling | None) -> None:
+        """Rebuild the state from a re-adopted device."""
+        self._last_state = None
+        super()._async_device_changed(device)
+
+    @callback
+    def _async_update_state(
+        self,
+        is_on: bool,
+        brightness: int,
+        hs_color: tuple[float, float],
+        color_temp_kelvin: int,
+    ) -> None:
+        """Update the entity attributes and write state only if they changed."""
+        color_mode = ColorMode.HS if hs_color[1] > 0 else ColorMode.COLOR_TEMP
+        state = (is_on, brightness, hs_color, color_temp_kelvin, color_mode)
+        if state == self._last_state:
+            return
+
+        self._last_state = state
+        self._attr_is_on = is_on
+        self._attr_brightness = brightness
+        self._attr_hs_color = hs_color
+        self._attr_color_temp_kelvin = color_temp_kelvin
+        self._attr_color_mode = color_mode
+        self.async_write_ha_state()
+
+
+class LIFXCeilingDownlight(LIFXCeilingLight):
+    """Represents the LIFX Ceiling downlight zone."""
+
+    def __init__(
+        self, coordinator: LIFXCeilingUpdateCoordinator, device: LIFXCeiling
+    ) -> None:
+        """Instantiate the zoned light."""
+        super().__init__(coordinator, device)
+        self._attr_name = "Downlight"
+        self._attr_unique_id = f"{format_mac(device.mac_addr)}_downlight"
+
     @callback
     def _update_callback(self) -> None:
         """Handle coordinator updates."""
-        self._attr_is_on = self._device.downlight_is_on
-        self._attr_brightness = self._device.downlight_brightness
-        self._attr_hs_color = self._device.downlight_hs_color
-        self._attr_color_temp_kelvin = self._device.downlight_kelvin
-        _, sat = self._device.downlight_hs_color
-        if sat > 0:
-            self._attr_color_mode = ColorMode.HS
-        else:
-            self._attr_color_mode = ColorMode.COLOR_TEMP
-        self.async_write_ha_state()
+        self._async_update_state(
+            self._device.downlight_is_on,
+            self._device.downlight_brightness,
+            self._device.downlight_hs_color,
+            self._device.downlight_kelvin,
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the downlight."""
@@ -98,38 +170,26 @@ class LIFXCeilingDownlight(LIFXCeilingEntity, LightEntity):
         self.async_write_ha_state()
 
 
-class LIFXCeilingUplight(LIFXCeilingEntity, LightEntity):
+class LIFXCeilingUplight(LIFXCeilingLight):
     """Represents the LIFX Ceiling uplight zone."""
 
-    _attr_supported_features = LightEntityFeature.TRANSITION
-
     def __init__(
         self, coordinator: LIFXCeilingUpdateCoordinator, device: LIFXCeiling
     ) -> None:
         """Instantiate the zoned light."""
         super().__init__(coordinator, device)
-        self._device = device
-        coordinator.async_add_core_listener(device, self._update_callback)
-
-        self._attr_supported_color_modes = {ColorMode.COLOR_TEMP, ColorMode.HS}
         self._attr_name = "Uplight"
         self._attr_unique_id = f"{format_mac(device.mac_addr)}_uplight"
-        self._attr_max_color_temp_kelvin = device.max_kelvin
-        self._attr_min_color_temp_kelvin = device.min_kelvin
 
     @callback
     def _update_callback(self) -> None:
         """Handle device updates."""
-        self._attr_is_on = self._device.uplight_is_on
-        self._attr_brightness = self._device.uplight_brightness
-        self._attr_hs_color = self._device.uplight_hs_color
-        self._attr_color_temp_kelvin = self._device.uplight_kelvin
-        _, sat = self._device.uplight_hs_color
-        if sat > 0:
-            self._attr_color_mode = ColorMode.HS
-        else:
-            self._attr_color_mode = ColorMode.COLOR_TEMP
-        self.async_write_ha_state()
+        self._async_update_state(
+            self._device.uplight_is_on,
+            self._device.uplight_brightness,
+            self._device.uplight_hs_color,
+            self._device.uplight_kelvin,
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the uplight."""
@@ -143,3 +203,45 @@ class LIFXCeilingUplight(LIFXCeilingEntity, LightEntity):
         color = hsbk_for_turn_on(self._device.uplight_color, **kwargs)
         await self.coordinator.turn_uplight_on(self._device, color, duration)
         self.async_write_ha_state()
+
+
+class LIFXCeilingZoneGroup(LIFXCeilingLight):
+    """Represents a configured group of LIFX Ceiling downlight zones."""
+
+    def __init__(
+        self,
+        coordinator: LIFXCeilingUpdateCoordinator,
+        device: LIFXCeiling,
+        group: str,
+    ) -> None:
+        """Instantiate the zone group light."""
+        super().__init__(coordinator, device)
+        self._group = group
+        self._attr_name = group.replace("_", " ").capitalize()
+        self._attr_unique_id = f"{format_mac(device.mac_addr)}_{group}"
+
+    @callback
+    def _update_callback(self) -> None:
+        """Handle device updates."""
+        hue, saturation, brightness, kelvin = self._device.zone_group_color(self._group)
+        self._async_update_state(
+            self._device.zone_group_is_on(self._group),
+            brightness_to_8bit(brightness),
+            hs_from_16bit(hue, saturation),
+            kelvin,
+        )
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off the zone group."""
+        duration = int(kwargs.get(ATTR_TRANSITION, 0))
+        await self.coordinator.turn_zone_group_off(self._device, self._group, duration)
+        self.async_write_ha_state()
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on the zone group."""
+        duration = int(kwargs.get(ATTR_TRANSITION, 0))
+        color = hsbk_for_turn_on(self._device.zone_group_color(self._group), **kwargs)
+        await self.coordinator.turn_zone_group_on(
+            self._device, self._group, color, duration
+        )
+        self.async_write_ha_state()
@@ -0,0 +1,117 @@
+"""Command timing metrics for LIFX Ceiling devices."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Upper bounds in milliseconds of the timing histogram buckets
+TIMING_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Number of recent commands kept per device for diagnostics
+COMMAND_HISTORY_SIZE = 20
+
+
+class TimingHistogram:
+    """Timings counted into fixed buckets, so recording never allocates."""
+
+    __slots__ = ("count", "counts", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(TIMING_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a timing in seconds."""
+        milliseconds = seconds * 1000
+        self.counts[bisect_left(TIMING_BUCKETS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Return the mean timing in milliseconds."""
+        return round(self.total_ms / self.count, 1) if self.count else None
+
+    def percentile_ms(self, percentile: float) -> float | None:
+        """Return the upper bound of the bucket that holds the given percentile."""
+        if not self.count:
+            return None
+        target = self.count * percentile / 100
+        seen = 0
+        for bound, bucket_count in zip(TIMING_BUCKETS_MS, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, round(self.max_ms, 1))
+        return round(self.max_ms, 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the histogram."""
+        labels = [f"<={bound}" for bound in TIMING_BUCKETS_MS]
+        labels.append(f">{TIMING_BUCKETS_MS[-1]}")
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile_ms(50),
+            "p95_ms": self.percentile_ms(95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets_ms": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass(slots=True)
+class LIFXCeilingMetrics:
+    """Timings and packet counts for a single device."""
+
+    command_latency: TimingHistogram = field(default_factory=TimingHistogram)
+    ack_time: TimingHistogram = field(default_factory=TimingHistogram)
+    refresh_duration: TimingHistogram = field(default_factory=TimingHistogram)
+    packets_sent: int = 0
+    retries: int = 0
+    failed_writes: int = 0
+    recent_commands: deque[tuple[float, tuple[str, ...], int, float, str | None]] = (
+        field(default_factory=partial(deque, maxlen=COMMAND_HISTORY_SIZE))
+    )
+
+    def record_command(
+        self,
+        sections: tuple[str, ...],
+        duration: int,
+        seconds: float,
+        error: str | None,
+    ) -> None:
+        """Keep the timing of a command, dropping the oldest when full."""
+        self.recent_commands.append((time.time(), sections, duration, seconds, error))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics as a dictionary."""
+        return {
+            "command_latency": self.command_latency.as_dict(),
+            "ack_time": self.ack_time.as_dict(),
+            "refresh_duration": self.refresh_duration.as_dict(),
+            "packets_sent": self.packets_sent,
+            "retries": self.retries,
+            "failed_writes": self.failed_writes,
+            "recent_commands": [
+                {
+                    "time": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                    "sections": list(sections),
+                    "transition": duration,
+                    "elapsed_ms": round(seconds * 1000, 1),
+                    "error": error,
+                }
+                for timestamp, sections, duration, seconds, error in (
+                    self.recent_commands
+                )
+            ],
+        }
@@ -0,0 +1,128 @@
+"""Per-zone downlight patterns for the LIFX Ceiling matrix."""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from pathlib import Path
+
+import homeassistant.util.color as color_util
+from PIL import Image
+
+from .convert import hue_to_16bit, percent_to_16bit
+from .geometry import DEFAULT_GEOMETRY, CeilingGeometry
+
+# Patterns have one color per downlight zone, which is every zone of the
+# matrix except the uplight. This is the count for the original 8x8 Ceiling.
+DOWNLIGHT_ZONE_COUNT = DEFAULT_GEOMETRY.downlight_zone_count
+
+PATTERN_CACHE_SIZE = 32
+
+type HSBK = tuple[int, int, int, int]
+
+
+def hsbk_from_rgb(
+    rgb: tuple[int, int, int], brightness_pct: float, kelvin: int
+) -> HSBK:
+    """Return an HSBK tuple for an RGB color scaled to a brightness percentage."""
+    hue, saturation, value = color_util.color_RGB_to_hsv(*rgb)
+    return (
+        hue_to_16bit(hue),
+        percent_to_16bit(saturation),
+        percent_to_16bit(value * brightness_pct / 100),
+        kelvin,
+    )
+
+
+def blend(start: HSBK, end: HSBK, amount: float) -> HSBK:
+    """Return the color amount of the way from start to end."""
+    # Hue wraps around, so blend along the shortest way around the color wheel.
+    hue_delta = ((end[0] - start[0] + 32768) % 65536) - 32768
+    return (
+        round(start[0] + hue_delta * amount) % 65536,
+        round(start[1] + (end[1] - start[1]) * amount),
+        round(start[2] + (end[2] - start[2]) * amount),
+        round(start[3] + (end[3] - start[3]) * amount),
+    )
+
+
+def _zone_positions(geometry: CeilingGeometry) -> list[tuple[float, float]]:
+    """Return the x, y position of each downlight zone relative to the center."""
+    center_x = (geometry.width - 1) / 2
+    center_y = (geometry.height - 1) / 2
+    return [
+        (index % geometry.width - center_x, index // geometry.width - center_y)
+        for index in geometry.downlight_zones
+    ]
+
+
+def _gradient(positions: list[float], start: HSBK, end: HSBK) -> tuple[HSBK, ...]:
+    """Map each zone position onto the gradient between start and end."""
+    low = min(positions)
+    span = (max(positions) - low) or 1
+    return tuple(blend(start, end, (position - low) / span) for position in positions)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def radial_gradient(
+    inner: HSBK, outer: HSBK, geometry: CeilingGeometry = DEFAULT_GEOMETRY
+) -> tuple[HSBK, ...]:
+    """Return downlight colors fading from inner at the center to outer."""
+    return _gradient(
+        [math.hypot(x, y) for x, y in _zone_positions(geometry)], inner, outer
+    )
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def linear_gradient(
+    start: HSBK, end: HSBK, angle: int, geometry: CeilingGeometry = DEFAULT_GEOMETRY
+) -> tuple[HSBK, ...]:
+    """
+    Return downlight colors fading from start to end.
+
+    Angle is in degrees, where 0 fades from left to right and 90 fades from top
+    to bottom.
+    """
+    cos = math.cos(math.radians(angle))
+    sin = math.sin(math.radians(angle))
+    return _gradient(
+        [x * cos + y * sin for x, y in _zone_positions(geometry)], start, end
+    )
+
+
+def image_pattern(
+    path: str,
+    brightness_pct: float,
+    kelvin: int,
+    geometry: CeilingGeometry = DEFAULT_GEOMETRY,
+) -> tuple[HSBK, ...]:
+    """
+    Return downlight colors from an image scaled down to the matrix size.
+
+    This does file I/O so must be run in the executor.
+    """
+    return _image_pattern(
+        path, Path(path).stat().st_mtime_ns, brightness_pct, kelvin, geometry
+    )
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _image_pattern(
+    path: str,
+    mtime_ns: int,
+    brightness_pct: float,
+    kelvin: int,
+    geometry: CeilingGeometry,
+) -> tuple[HSBK, ...]:
+    """Return downlight colors for a specific version of an image file."""
+    with Image.open(path) as image:
+        pixels = list(
+            image.convert("RGB")
+            .resize((geometry.width, geometry.height), Image.Resampling.BOX)
+            .getdata()
+        )
+
+    return tuple(
+        hsbk_from_rgb(pixels[index], brightness_pct, kelvin)
+        for index in geometry.downlight_zones
+    )
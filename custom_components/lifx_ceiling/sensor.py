@@ -0,0 +1,156 @@
+"""LIFX Ceiling diagnostic sensors."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import format_mac
+
+from .entity import LIFXCeilingEntity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
+    from .api import LIFXCeiling
+    from .coordinator import (
+        LIFXCeilingConfigEntry,
+        LIFXCeilingUpdateCoordinator,
+    )
+    from .metrics import LIFXCeilingMetrics, TimingHistogram
+
+PARALLEL_UPDATES = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class LIFXCeilingSensorEntityDescription(SensorEntityDescription):
+    """Describes a LIFX Ceiling metrics sensor."""
+
+    value_fn: Callable[[LIFXCeilingMetrics], int | float | None]
+    histogram_fn: Callable[[LIFXCeilingMetrics], TimingHistogram] | None = None
+
+
+def _timing_sensor(
+    key: str, name: str, histogram_fn: Callable[[LIFXCeilingMetrics], TimingHistogram]
+) -> LIFXCeilingSensorEntityDescription:
+    """Describe a sensor showing the mean of a timing histogram."""
+    return LIFXCeilingSensorEntityDescription(
+        key=key,
+        name=name,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: histogram_fn(metrics).mean_ms,
+        histogram_fn=histogram_fn,
+    )
+
+
+def _counter_sensor(
+    key: str, name: str, value_fn: Callable[[LIFXCeilingMetrics], int]
+) -> LIFXCeilingSensorEntityDescription:
+    """Describe a sensor showing an increasing count."""
+    return LIFXCeilingSensorEntityDescription(
+        key=key,
+        name=name,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=value_fn,
+    )
+
+
+SENSORS: tuple[LIFXCeilingSensorEntityDescription, ...] = (
+    _timing_sensor(
+        "command_latency", "Command latency", lambda metrics: metrics.command_latency
+    ),
+    _timing_sensor(
+        "ack_time", "Acknowledgement time", lambda metrics: metrics.ack_time
+    ),
+    _timing_sensor(
+        "refresh_duration", "Refresh duration", lambda metrics: metrics.refresh_duration
+    ),
+    _counter_sensor(
+        "packets_sent", "Packets sent", lambda metrics: metrics.packets_sent
+    ),
+    _counter_sensor("retries", "Retries", lambda metrics: metrics.retries),
+    _counter_sensor(
+        "failed_writes", "Failed writes", lambda metrics: metrics.failed_writes
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: LIFXCeilingConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    """Set up LIFX Ceiling diagnostic sensors."""
+    coordinator: LIFXCeilingUpdateCoordinator = entry.runtime_data
+
+    @callback
+    def _add_sensors(device: LIFXCeiling) -> None:
+        async_add_entities(
+            LIFXCeilingMetricsSensor(coordinator, device, description)
+            for description in SENSORS
+        )
+
+    for device in coordinator.devices:
+        _add_sensors(device)
+
+    @callback
+    def _add_ceiling_entities(device: LIFXCeiling) -> None:
+        _add_sensors(device)
+        if previous_callback is not None:
+            previous_callback(device)
+
+    # Chain to the discovery callback of any platform that was set up first.
+    previous_callback = coordinator.set_discovery_callback(_add_ceiling_entities)
+
+
+class LIFXCeilingMetricsSensor(LIFXCeilingEntity, SensorEntity):
+    """Represents a command timing or packet count of a LIFX Ceiling."""
+
+    entity_description: LIFXCeilingSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: LIFXCeilingUpdateCoordinator,
+        device: LIFXCeiling,
+        description: LIFXCeilingSensorEntityDescription,
+    ) -> None:
+        """Instantiate the sensor."""
+        super().__init__(coordinator, device)
+        self.entity_description = description
+        self._attr_unique_id = f"{format_mac(device.mac_addr)}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for updates from the core LIFX coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_core_listener(
+                self._device, self._update_callback
+            )
+        )
+
+    @property
+    def native_value(self) -> int | float | None:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self._device.metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the histogram behind a timing sensor."""
+        if self.entity_description.histogram_fn is None:
+            return None
+        return self.entity_description.histogram_fn(self._device.metrics).as_dict()
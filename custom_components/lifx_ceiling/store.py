@@ -0,0 +1,53 @@
+"""Section state of LIFX Ceiling devices remembered across restarts."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .api import LIFXCeiling
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+
+
+class LIFXCeilingStore:
+    """Keep the section state of every device, keyed by its mac_addr."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._devices: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the remembered state of all devices."""
+        self._devices = await self._store.async_load() or {}
+
+    def get(self, mac_addr: str) -> dict[str, Any] | None:
+        """Return the remembered state of a device."""
+        return self._devices.get(mac_addr)
+
+    @callback
+    def async_save_device(self, device: LIFXCeiling) -> None:
+        """Remember the current state of a device, batching writes to disk."""
+        self._devices[device.mac_addr] = device.state_to_store()
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the state of all devices to write to disk."""
+        return self._devices
+
+    async def async_remove(self) -> None:
+        """Delete the remembered state of all devices."""
+        self._devices = {}
+        await self._store.async_remove()
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-import homeassistant.util.color as color_util
 from awesomeversion import AwesomeVersion
 from homeassistant.components.lifx.const import DOMAIN as LIFX_DOMAIN
 from homeassistant.components.lifx.const import LIFX_CEILING_PRODUCT_IDS
@@ -27,6 +26,12 @@ from .const import (
     HSBK_SATURATION,
     RUNTIME_DATA_HASS_VERSION,
 )
+from .convert import (
+    brightness_to_16bit,
+    color_name_to_16bit,
+    hs_to_16bit,
+    percent_to_brightness_16bit,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -93,9 +98,7 @@ def hsbk_for_turn_on(
 
     if (color_name := kwargs.get(ATTR_COLOR_NAME)) is not None:
         try:
-            hue, saturation = color_util.color_RGB_to_hs(
-                *color_util.color_name_to_rgb(color_name)
-            )
+            hue, saturation = color_name_to_16bit(color_name)
         except ValueError:
             _LOGGER.warning(
                 "Got unknown color %s, falling back to neutral white", color_name
@@ -103,11 +106,9 @@ def hsbk_for_turn_on(
             hue, saturation = (0, 0)
 
     if ATTR_HS_COLOR in kwargs:
-        hue, saturation = kwargs[ATTR_HS_COLOR]
+        hue, saturation = hs_to_16bit(kwargs[ATTR_HS_COLOR])
 
     if hue is not None and saturation is not None:
-        hue = int(hue / 360 * 65535)
-        saturation = int(saturation / 100 * 65535)
         kelvin = 3500
     else:
         hue = current[HSBK_HUE]
@@ -120,12 +121,10 @@ def hsbk_for_turn_on(
         kelvin = current[HSBK_KELVIN]
 
     if ATTR_BRIGHTNESS in kwargs:
-        scaled_brightness = kwargs[ATTR_BRIGHTNESS]
-        brightness = (scaled_brightness << 8) | scaled_brightness
+        brightness = brightness_to_16bit(kwargs[ATTR_BRIGHTNESS])
 
     if ATTR_BRIGHTNESS_PCT in kwargs:
-        scaled_brightness = round(255 * kwargs[ATTR_BRIGHTNESS_PCT] / 100)
-        brightness = (scaled_brightness << 8) | scaled_brightness
+        brightness = percent_to_brightness_16bit(kwargs[ATTR_BRIGHTNESS_PCT])
 
     if brightness is None:
         brightness = current[HSBK_BRIGHTNESS]
@@ -0,0 +1,222 @@
+"""Acknowledged set64 delivery for LIFX Ceiling zone writes."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from aiolifx.msgtypes import TileSet64
+
+from .const import _LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from aiolifx.aiolifx import Light
+
+    from .metrics import LIFXCeilingMetrics
+
+# Writes to a device that can be waiting for an acknowledgement at the same time
+SET64_MAX_IN_FLIGHT = 2
+
+# Seconds aiolifx waits for an acknowledgement before sending a write again
+SET64_ACK_TIMEOUT = 0.5
+
+
+class LIFXCeilingWriteError(Exception):
+    """A zone write was not acknowledged in time."""
+
+
+@dataclass(slots=True)
+class _ZoneWrite:
+    """A set64 payload, the zones it covers and the futures waiting for it."""
+
+    payload: dict[str, Any]
+    zones: int
+    waiters: list[asyncio.Future[None]]
+    superseded: bool = False
+    ack: asyncio.Future[Any] | None = field(default=None, repr=False)
+    request: list[Any] | None = field(default=None, repr=False)
+
+
+class LIFXCeilingWriteQueue:
+    """
+    Deliver set64 writes to a device with acknowledgements and retries.
+
+    A queued write is dropped when a newer write covers all of its zones, so
+    only the latest colors are sent. A write in flight stops retrying once it
+    has been superseded. Writes only go out together when they cover different
+    zones or the newer one replaces the older, so a retry can never overwrite
+    newer colors.
+
+    Retries are left to aiolifx within a single request, as it only marks a
+    device as gone once every attempt has timed out.
+    """
+
+    def __init__(
+        self,
+        device: Light,
+        metrics: LIFXCeilingMetrics,
+        zone_count: int,
+        matrix_width: int,
+        timeout: float,
+    ) -> None:
+        """Initialize the queue for a device."""
+        self._device = device
+        self._metrics = metrics
+        self._zone_count = zone_count
+        self._matrix_width = matrix_width
+        self._max_attempts = max(1, round(timeout / SET64_ACK_TIMEOUT))
+        self._queued: list[_ZoneWrite] = []
+        self._in_flight: list[_ZoneWrite] = []
+
+    def _zone_mask(self, x: int, y: int, width: int) -> int:
+        """
+        Return a bit mask of the zones a set64 write changes.
+
+        set64 always sends 64 colors, so a write covers every row from y down
+        and the columns from x to x + width, clipped to the matrix.
+        """
+        height = self._zone_count // self._matrix_width
+        mask = 0
+        for index in range(64):
+            column = x + index % width
+            row = y + index // width
+            if column < self._matrix_width and row < height:
+                mask |= 1 << (row * self._matrix_width + column)
+        return mask
+
+    def submit(  # noqa: PLR0913
+        self,
+        *,
+        tile_index: int = 0,
+        x: int = 0,
+        y: int = 0,
+        width: int,
+        duration: float = 0,
+        colors: Sequence[tuple[int, int, int, int]],
+    ) -> asyncio.Future[None]:
+        """Queue a write and return a future that completes when it is delivered."""
+        padded = list(colors[:64])
+        padded.extend([(0, 0, 0, 3500)] * (64 - len(padded)))
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        write = _ZoneWrite(
+            payload={
+                "tile_index": tile_index,
+                "length": 1,
+                "fb_index": 0,
+                "x": x,
+                "y": y,
+                "width": width,
+                "duration": round(duration * 1000),
+                "colors": padded,
+            },
+            zones=self._zone_mask(x, y, width),
+            waiters=[future],
+        )
+
+        for queued in list(self._queued):
+            if queued.zones & ~write.zones == 0:
+                # The new write replaces every zone, so only send the new one.
+                self._queued.remove(queued)
+                write.waiters.extend(queued.waiters)
+        for in_flight in self._in_flight:
+            if in_flight.zones & ~write.zones == 0:
+                self._supersede(in_flight)
+
+        self._queued.append(write)
+        self._send_next()
+        return future
+
+    def _supersede(self, write: _ZoneWrite) -> None:
+        """Stop aiolifx from sending an in flight write again."""
+        write.superseded = True
+        # aiolifx stops retrying once the request is gone from its message
+        # table. Sequence numbers wrap, so only remove the entry if it is ours.
+        messages = self._device.message
+        for seq_num, request in list(messages.items()):
+            if request is write.request:
+                del messages[seq_num]
+        if write.ack is not None and not write.ack.done():
+            write.ack.set_result(None)
+
+    def _can_send(self, write: _ZoneWrite) -> bool:
+        """Return if a write can go out without racing an older write."""
+        return len(self._in_flight) < SET64_MAX_IN_FLIGHT and all(
+            in_flight.superseded or in_flight.zones & write.zones == 0
+            for in_flight in self._in_flight
+        )
+
+    def _send_next(self) -> None:
+        """Start delivering queued writes, oldest first, while allowed."""
+        while self._queued and self._can_send(self._queued[0]):
+            write = self._queued.pop(0)
+            self._in_flight.append(write)
+            # Start eagerly so the request is handed to aiolifx, in order,
+            # before the caller yields. aiolifx sends it on the next loop pass.
+            # The task is kept alive by the acknowledgement it waits for, which
+            # the write in flight holds.
+            asyncio.Task(
+                self._async_deliver(write),
+                loop=asyncio.get_running_loop(),
+                eager_start=True,
+            )
+
+    async def _async_deliver(self, write: _ZoneWrite) -> None:
+        """Send a write until it is acknowledged, superseded or times out."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        error: Exception | None = None
+        try:
+            write.ack = loop.create_future()
+            self._device.req_with_ack(
+                TileSet64,
+                write.payload,
+                callb=partial(_set_ack, write.ack),
+                timeout_secs=SET64_ACK_TIMEOUT,
+                max_attempts=self._max_attempts,
+            )
+            # req_with_ack adds the request under the newest sequence number.
+            write.request = self._device.message.get(self._device.seq)
+            acknowledged = await write.ack is not None
+            elapsed = loop.time() - started
+
+            # aiolifx sends the write again every time an acknowledgement
+            # times out, so the number of retries follows from the wait.
+            retries = min(int(elapsed // SET64_ACK_TIMEOUT), self._max_attempts - 1)
+            self._metrics.packets_sent += 1 + retries
+            self._metrics.retries += retries
+            if retries:
+                _LOGGER.debug(
+                    "Zone write to %s was sent %d times",
+                    self._device.mac_addr,
+                    1 + retries,
+                )
+            if acknowledged:
+                self._metrics.ack_time.record(elapsed)
+            elif not write.superseded:
+                self._metrics.failed_writes += 1
+                error = LIFXCeilingWriteError(
+                    f"Zone write to {self._device.mac_addr} was not acknowledged"
+                )
+        except Exception as err:  # noqa: BLE001
+            self._metrics.failed_writes += 1
+            error = err
+        finally:
+            self._in_flight.remove(write)
+            for waiter in write.waiters:
+                if waiter.done():
+                    continue
+                if error is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(error)
+            self._send_next()
+
+
+def _set_ack(ack: asyncio.Future[Any], _device: Light, message: Any) -> None:
+    """Resolve an acknowledgement future with the message, or None on timeout."""
+    if not ack.done():
+        ack.set_result(message)